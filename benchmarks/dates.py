@@ -0,0 +1,92 @@
+"""
+Restore-heavy workload: restore objects and read their date/time fields,
+with the current parsers and with the strptime-based ones they replaced
+
+    python benchmarks/dates.py [count]
+"""
+import datetime as dt
+import sys
+import timeit
+
+from strictdict import StrictDict
+from strictdict import fields as f
+from strictdict import simplifiers
+
+
+class StrptimeDate(simplifiers.DateSimplifier):
+    @staticmethod
+    def deserialize(data_str):
+        return dt.datetime.strptime(data_str, '%Y-%m-%d').date()
+
+
+class StrptimeDateTime(simplifiers.DateTimeSimplifier):
+    @staticmethod
+    def deserialize(data_str):
+        try:
+            return dt.datetime.strptime(data_str, '%Y-%m-%dT%H:%M')
+        except ValueError:
+            return dt.datetime.strptime(data_str, '%Y-%m-%dT%H:%M:%SZ')
+
+
+class StrptimeTime(simplifiers.TimeSimplifier):
+    @staticmethod
+    def deserialize(data_str):
+        try:
+            return dt.datetime.strptime(data_str, '%H:%M').time()
+        except ValueError:
+            return dt.datetime.strptime(data_str, '%H:%M:%S').time()
+
+
+class StrptimeTimeStamp(simplifiers.TimeStampSimplifier):
+    DATE_FORMATS = ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f',
+                    '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ']
+
+    @classmethod
+    def deserialize(cls, data_str):
+        for format in cls.DATE_FORMATS:
+            try:
+                return dt.datetime.strptime(data_str, format)
+            except ValueError:
+                pass
+        raise ValueError
+
+
+def make_schema(date, datetime, time, timestamp):
+    class Event(StrictDict):
+        date = f.Date()
+        datetime = f.DateTime()
+        time = f.Time()
+        timestamp = f.TimeStamp()
+
+    fields = Event.__fields__
+    fields['date'].simplifier = date
+    fields['datetime'].simplifier = datetime
+    fields['time'].simplifier = time
+    fields['timestamp'].simplifier = timestamp
+    return Event
+
+
+def main(count):
+    data = [{'date': '2013-07-08', 'datetime': '2013-11-18T10:11:12Z',
+             'time': '10:11:12', 'timestamp': '2013-11-18T10:11:12.123456Z'}
+            for _ in range(count)]
+    schemas = [
+        ('strptime', make_schema(StrptimeDate, StrptimeDateTime,
+                                 StrptimeTime, StrptimeTimeStamp)),
+        ('iso8601', make_schema(simplifiers.DateSimplifier,
+                                simplifiers.DateTimeSimplifier,
+                                simplifiers.TimeSimplifier,
+                                simplifiers.TimeStampSimplifier)),
+    ]
+    for name, Event in schemas:
+        def restore_and_read():
+            for item in data:
+                obj = Event.restore(dict(item))
+                obj.date, obj.datetime, obj.time, obj.timestamp
+
+        best = min(timeit.repeat(restore_and_read, number=1, repeat=5))
+        print('{:<10} {:>8.2f} us/object'.format(name, best / count * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
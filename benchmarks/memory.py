@@ -0,0 +1,61 @@
+"""
+Bytes per instance for flat and nested schemas, default vs compact layout
+
+    python benchmarks/memory.py [count]
+"""
+import sys
+import tracemalloc
+
+from strictdict import StrictDict
+from strictdict import fields as f
+
+
+def make_schema(compact):
+    class Leg(StrictDict):
+        is_compact = compact
+        is_working = f.Bool()
+        number = f.Int()
+        name = f.String()
+        boot_size = f.Float(required=False)
+        market_price = f.Decimal(required=False)
+
+    class Centipede(StrictDict):
+        is_compact = compact
+        age = f.Int()
+        legs = f.ViewModelField(class_=Leg, is_list=True)
+
+    return Leg, Centipede
+
+
+def leg_data(number):
+    return {'is_working': True, 'number': number, 'name': 'Martha',
+            'boot_size': 37.5, 'market_price': '123.45'}
+
+
+def measure(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objs
+    return size / count
+
+
+def main(count):
+    print('{:<10} {:>12} {:>12}'.format('schema', 'default', 'compact'))
+    results = {}
+    for compact in (False, True):
+        Leg, Centipede = make_schema(compact)
+        results.setdefault('flat', []).append(measure(
+            lambda i: Leg(**leg_data(i)), count))
+        results.setdefault('nested', []).append(measure(
+            lambda i: Centipede(age=i, legs=[leg_data(n) for n in range(10)]),
+            count // 10))
+    for schema, (default, compact) in results.items():
+        print('{:<10} {:>12.0f} {:>12.0f}'.format(schema, default, compact))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -1,3 +1,7 @@
 from .strictbase import *
+from .store import StrictDictStore
+from .collection import StrictDictCollection
+from .shared import SharedBatch
 from .validators import ValidationError
 from . import api
+from . import backends
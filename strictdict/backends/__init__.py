@@ -0,0 +1,206 @@
+"""
+JSON backends are interchangeable encoders/decoders used by
+StrictDict.dumps() and .loads(). Stdlib json is the default, faster ones are
+opt-in via set_default_backend() or StrictDict.json_backend. All of them
+take and return simplified data, so output of one can be read by any other.
+
+Fast backends write compact UTF-8 text instead of stdlib's escaped one, but
+decode to the same data: values they can not handle the stdlib way (ints
+beyond 64 bits, NaN and infinities, map keys which are not strings) are
+passed to stdlib json
+"""
+import json
+import math
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = ['get_backend', 'register_backend', 'set_default_backend',
+           'available_backends']
+
+# Known backends, fastest first
+PREFERENCE = ['orjson', 'rapidjson', 'ujson', 'json']
+DEFAULT = 'json'
+
+_backends = {}
+# Explicitly chosen default
+_default = None
+
+# Integer part which may not fit 64 bits (-2 ** 63 - 1 has 19 digits), or a
+# long fraction; either way stdlib json decodes it exactly
+_LONG_NUMBER = re.compile(r'\d{19}')
+_LONG_NUMBER_BYTES = re.compile(br'\d{19}')
+
+_INT_MIN = -2 ** 63
+_INT_MAX = 2 ** 64 - 1
+
+
+def _is_plain(data):
+    """
+    Whether `data` has only string map keys, ints fitting 64 bits and finite
+    floats
+    """
+    if isinstance(data, dict):
+        return all(isinstance(key, str) and _is_plain(value)
+                   for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return all(_is_plain(item) for item in data)
+    if isinstance(data, float):
+        return math.isfinite(data)
+    if isinstance(data, int):
+        return _INT_MIN <= data <= _INT_MAX
+    return True
+
+
+class JSONBackend(object):
+    name = 'json'
+    # Put between items when joining already encoded list elements
+    separator = ', '
+
+    @staticmethod
+    def dumps(data):
+        return json.dumps(data)
+
+    @classmethod
+    def dumps_bytes(cls, data):
+        return cls.dumps(data).encode('utf-8')
+
+    @staticmethod
+    def loads(data_str):
+        if isinstance(data_str, (bytes, bytearray, memoryview)):
+            data_str = bytes(data_str).decode('utf-8')
+        return json.loads(data_str)
+
+
+class OrjsonBackend(JSONBackend):
+    name = 'orjson'
+    separator = ','
+
+    @classmethod
+    def dumps(cls, data):
+        return cls.dumps_bytes(data).decode('utf-8')
+
+    @staticmethod
+    def dumps_bytes(data):
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Integer beyond 64 bits
+            return JSONBackend.dumps_bytes(data)
+        if b'null' in encoded:
+            # Might be NaN or infinity silently written as null
+            return JSONBackend.dumps_bytes(data)
+        return encoded
+
+    @staticmethod
+    def loads(data_str):
+        if isinstance(data_str, (bytearray, memoryview)):
+            data_str = bytes(data_str)
+        pattern = _LONG_NUMBER_BYTES if isinstance(data_str, bytes) \
+            else _LONG_NUMBER
+        # Long integers would be decoded to floats
+        if pattern.search(data_str) is None:
+            try:
+                return orjson.loads(data_str)
+            except orjson.JSONDecodeError:
+                # NaN, infinity or invalid input, stdlib decides
+                pass
+        return JSONBackend.loads(data_str)
+
+
+class RapidJSONBackend(JSONBackend):
+    name = 'rapidjson'
+    separator = ','
+
+    @staticmethod
+    def dumps(data):
+        try:
+            return rapidjson.dumps(data)
+        except TypeError:
+            # Map keys which are not strings, rapidjson would write True as
+            # "True" instead of "true"
+            return JSONBackend.dumps(data)
+
+    @staticmethod
+    def loads(data_str):
+        try:
+            return rapidjson.loads(data_str)
+        except rapidjson.JSONDecodeError:
+            # Out of range floats or invalid input, stdlib decides
+            return JSONBackend.loads(data_str)
+
+
+class UJSONBackend(JSONBackend):
+    name = 'ujson'
+    separator = ','
+
+    @staticmethod
+    def dumps(data):
+        # Checked upfront: ujson writes nothing for an int beyond 64 bits
+        # followed by other items, infinity as invalid 'Inf' and True map
+        # keys as "True", all without raising
+        if not _is_plain(data):
+            return JSONBackend.dumps(data)
+        return ujson.dumps(data)
+
+    @staticmethod
+    def loads(data_str):
+        try:
+            return ujson.loads(data_str)
+        except ValueError:
+            # Long integers, NaN, infinity or invalid input, stdlib decides
+            return JSONBackend.loads(data_str)
+
+
+def register_backend(backend):
+    """
+    Make backend available by its name
+    """
+    _backends[backend.name] = backend
+
+
+def available_backends():
+    return [name for name in PREFERENCE if name in _backends] + \
+        sorted(name for name in _backends if name not in PREFERENCE)
+
+
+def set_default_backend(name):
+    """
+    Use backend `name` for classes which do not set json_backend.
+    None restores stdlib json
+    """
+    global _default
+    if name is not None and name not in _backends:
+        raise ValueError('Unknown JSON backend: {}'.format(name))
+    _default = name
+
+
+def get_backend(name=None):
+    if name is None:
+        name = _default or DEFAULT
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError('Unknown JSON backend: {}'.format(name))
+
+
+register_backend(JSONBackend)
+if orjson is not None:
+    register_backend(OrjsonBackend)
+if rapidjson is not None:
+    register_backend(RapidJSONBackend)
+if ujson is not None:
+    register_backend(UJSONBackend)
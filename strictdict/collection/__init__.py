@@ -0,0 +1,233 @@
+"""
+In-memory collection of StrictDicts of one class with secondary indexes.
+
+Index keys are simplified field values, read from simplify() output without
+deserializing anything. Hash indexes answer equality lookups, sorted ones
+answer equality and range lookups with binary search. The collection is
+append-only, so positions stored in indexes never change
+"""
+import bisect
+
+from .. import fields as f
+
+__all__ = ['StrictDictCollection']
+
+# Fields whose simplified values order the same way as the values
+SORTABLE_FIELDS = (f.Bool, f.Int, f.Float, f.String, f.Date, f.DateTime,
+                   f.Time, f.TimeStamp)
+
+
+def _hashable(value):
+    # Simplified lists come as tuples from constructors, as lists from loads()
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class _HashIndex(object):
+
+    def __init__(self):
+        # key: positions in insertion order
+        self.positions = {}
+
+    def add(self, key, position):
+        self.positions.setdefault(key, []).append(position)
+
+    def lookup(self, key):
+        return self.positions.get(key, [])
+
+
+class _SortedIndex(object):
+
+    def __init__(self):
+        # Parallel lists ordered by (key, position); missing values are not
+        # indexed, as None does not compare with keys
+        self.keys = []
+        self.positions = []
+        self.pending = []
+
+    def add(self, key, position):
+        if key is not None:
+            self.pending.append((key, position))
+
+    def _merge(self):
+        # Appends are batched: one sort of an ordered run followed by new
+        # entries instead of an insort per record
+        if self.pending:
+            pairs = sorted(list(zip(self.keys, self.positions)) + self.pending)
+            self.keys = [key for key, _ in pairs]
+            self.positions = [position for _, position in pairs]
+            self.pending = []
+
+    def lookup(self, key):
+        if key is None:
+            return None
+        return self.range(key, key)
+
+    def range(self, low, high):
+        self._merge()
+        start = 0 if low is None else bisect.bisect_left(self.keys, low)
+        stop = len(self.keys) if high is None else \
+            bisect.bisect_right(self.keys, high)
+        return self.positions[start:stop]
+
+
+class StrictDictCollection(object):
+    """
+    `hash_indexes` and `sorted_indexes` are names of fields to index. Both
+    kinds can be declared for one field
+    """
+
+    def __init__(self, class_, objs=(), hash_indexes=(), sorted_indexes=()):
+        self.class_ = class_
+        self._objects = []
+        self._hash_indexes = {}
+        self._sorted_indexes = {}
+        for name in hash_indexes:
+            self._check_field(name)
+            self._hash_indexes[name] = _HashIndex()
+        for name in sorted_indexes:
+            self._check_field(name, sortable=True)
+            self._sorted_indexes[name] = _SortedIndex()
+        self.extend(objs)
+
+    def _check_field(self, name, sortable=False):
+        try:
+            field = self.class_.__fields__[name]
+        except KeyError:
+            raise KeyError('No such field: "{}"'.format(name))
+        # Simplified nested objects and maps are dicts, not usable as keys
+        if isinstance(field, (f.ViewModelField, f.MapField)):
+            raise ValueError('Can not index "{}"'.format(name))
+        if sortable and (field.is_list or field.is_set or
+                         not isinstance(field, SORTABLE_FIELDS)):
+            raise ValueError('Can not sort by "{}"'.format(name))
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __getitem__(self, index):
+        return self._objects[index]
+
+    def append(self, obj):
+        if not isinstance(obj, self.class_):
+            raise TypeError('Not a {}'.format(self.class_.__name__))
+        position = len(self._objects)
+        self._objects.append(obj)
+        if self._hash_indexes or self._sorted_indexes:
+            simplified = obj.simplify()
+            for name, index in self._hash_indexes.items():
+                index.add(self._field_key(name, simplified.get(name)), position)
+            for name, index in self._sorted_indexes.items():
+                index.add(simplified.get(name), position)
+
+    def extend(self, objs):
+        for obj in objs:
+            self.append(obj)
+
+    def _field_key(self, name, value):
+        field = self.class_.__fields__[name]
+        if isinstance(field, f.Decimal) and value is not None:
+            # Simplified '1.0' and '1.00' are the same value
+            return field.deserialize(value)
+        if field.is_set and value is not None:
+            # Restored sets keep the order they were encoded in
+            return tuple(f.canonical_order(_hashable(value)))
+        return _hashable(value)
+
+    def _query_key(self, name, value):
+        """
+        Simplified form of `value` given for field `name` in a query
+        """
+        try:
+            field = self.class_.__fields__[name]
+        except KeyError:
+            raise KeyError('No such field: "{}"'.format(name))
+        if value is None:
+            return None
+        return self._field_key(name, field.serialize(field.validate(value, name)))
+
+    def _key(self, obj, name):
+        return self._field_key(name, obj.simplify().get(name))
+
+    def _lookup(self, name, key):
+        """
+        Positions of records with `key` for field `name` in insertion order,
+        None without a usable index
+        """
+        if name in self._hash_indexes:
+            return self._hash_indexes[name].lookup(key)
+        if name in self._sorted_indexes:
+            # Equal keys are ordered by position already
+            return self._sorted_indexes[name].lookup(key)
+        return None
+
+    def filter(self, **conditions):
+        """
+        Records whose fields are equal to all given values, in insertion
+        order. The most selective indexed condition picks candidates, the
+        rest are checked on them
+        """
+        keys = {name: self._query_key(name, value)
+                for name, value in conditions.items()}
+        candidates = None
+        indexed = None
+        for name, key in keys.items():
+            positions = self._lookup(name, key)
+            if positions is not None and (
+                    candidates is None or len(positions) < len(candidates)):
+                candidates, indexed = positions, name
+        if candidates is None:
+            candidates = range(len(self._objects))
+        rest = [(name, key) for name, key in keys.items() if name != indexed]
+        objects = self._objects
+        result = []
+        for position in candidates:
+            obj = objects[position]
+            if all(self._key(obj, name) == key for name, key in rest):
+                result.append(obj)
+        return result
+
+    def range(self, name, low=None, high=None):
+        """
+        Records with `low` <= field `name` <= `high` (None for no bound)
+        in field order. Records missing the field are never returned
+        """
+        low = self._query_key(name, low)
+        high = self._query_key(name, high)
+        if name in self._sorted_indexes:
+            positions = self._sorted_indexes[name].range(low, high)
+            return [self._objects[position] for position in positions]
+        self._check_field(name, sortable=True)
+        matching = []
+        for position, obj in enumerate(self._objects):
+            key = self._key(obj, name)
+            if key is not None and (low is None or low <= key) and \
+                    (high is None or key <= high):
+                matching.append((key, position))
+        matching.sort()
+        return [self._objects[position] for _, position in matching]
+
+    def group_by(self, name):
+        """
+        Dict of field `name` values to lists of records having them, in
+        insertion order
+        """
+        self._check_field(name)
+        field = self.class_.__fields__[name]
+        if name in self._hash_indexes:
+            groups = self._hash_indexes[name].positions
+        else:
+            groups = {}
+            for position, obj in enumerate(self._objects):
+                groups.setdefault(self._key(obj, name), []).append(position)
+        merged = {}
+        for key, positions in groups.items():
+            # Different keys may stand for one value
+            merged.setdefault(field.deserialize(key), []).extend(positions)
+        objects = self._objects
+        return {value: [objects[position] for position in sorted(positions)]
+                for value, positions in merged.items()}
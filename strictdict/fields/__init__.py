@@ -1,4 +1,6 @@
 import collections
+import functools
+import json
 from ..validators import *
 from ..simplifiers import *
 
@@ -6,12 +8,87 @@ from ..simplifiers import *
 class Field(object):
     validator = None
     simplifier = None
+    # Whether simplified and input values can be cached by `intern`
+    is_internable = True
+    # Entries kept per cache for intern=True without explicit cache_size
+    DEFAULT_CACHE_SIZE = 1024
 
-    def __init__(self, required=True, is_list=False, is_set=False,
-                 *args, **kwargs):
+    def __init__(self, required=True, is_list=False, is_set=False, *args,
+                 intern=False, cache_size=None, **kwargs):
         self.required = required
         self.is_list = is_list
         self.is_set = is_set
+        self._validate_cache = None
+        if intern or cache_size:
+            self._intern(cache_size or self.DEFAULT_CACHE_SIZE)
+        self._compile()
+
+    def __setattr__(self, name, value):
+        super(Field, self).__setattr__(name, value)
+        if name == 'simplifier' and 'is_set' in self.__dict__:
+            # Compiled serialize() and deserialize() bind the simplifier
+            self._compile()
+
+    def _compile(self):
+        """
+        Replace validate(), serialize() and deserialize() with functions
+        built for this field's exact configuration, so that calls do not
+        branch on is_list/is_set or look up validators and simplifiers.
+        Has to be called again whenever the configuration changes (setting
+        simplifier does it). Methods overridden in subclasses are left alone
+        """
+        cls = type(self)
+        if '_validate' in self.__dict__ or cls._validate is not Field._validate:
+            validate_item = self._validate
+        else:
+            validate_item = self.validator
+        overridden = (
+            cls.validate is not Field.validate or
+            self.is_list and cls._validate_list is not Field._validate_list or
+            self.is_set and cls._validate_set is not Field._validate_set)
+        if overridden or validate_item is None:
+            self.__dict__.pop('validate', None)
+        else:
+            self.validate = _compile_validate(self, validate_item)
+        if self.simplifier is None:
+            return
+        if cls.serialize is Field.serialize and cls.is_empty is Field.is_empty:
+            self.serialize = _compile_serialize(self)
+        if cls.deserialize is Field.deserialize and \
+                cls.empty_value is Field.empty_value:
+            self.deserialize = _compile_deserialize(self)
+
+    def _intern(self, maxsize):
+        """
+        Make equal values share one object: both validated inputs and
+        deserialized values are looked up in bounded LRU caches first
+        """
+        if not self.is_internable:
+            raise ValueError('{} can not intern values'.format(
+                self.__class__.__name__))
+        validate = self._validate
+        cache = functools.lru_cache(maxsize)(lambda key: validate(key.data))
+
+        def _validate(data):
+            try:
+                key = InternKey(data)
+            except TypeError:
+                # Unhashable input
+                return validate(data)
+            return cache(key)
+
+        self._validate = _validate
+        self._validate_cache = cache
+        self.simplifier = interned_simplifier(self.simplifier, maxsize)
+
+    def cache_info(self):
+        """
+        Hit/miss counters of interning caches, None if field does not intern
+        """
+        if self._validate_cache is None:
+            return None
+        return {'validate': self._validate_cache.cache_info(),
+                'deserialize': self.simplifier.cache_info()}
 
     def _validate(self, data):
         return self.validator(data)
@@ -34,8 +111,7 @@ class Field(object):
                 return self._validate_set(data)
             return self._validate(data)
         except ValidationError as exc:
-            if not exc.value:
-                exc.value = repr(data)
+            exc.set_default_value(data)
             exc.path.append(key)
             exc.class_ = self.__class__
             raise exc
@@ -43,7 +119,10 @@ class Field(object):
     def serialize(self, data):
         if self.is_empty(data):
             return None
-        if self.is_list or self.is_set:
+        if self.is_set:
+            return tuple(canonical_order(
+                [self.simplifier.serialize(item) for item in data]))
+        if self.is_list:
             return tuple(self.simplifier.serialize(item) for item in data)
         return self.simplifier.serialize(data)
 
@@ -76,6 +155,109 @@ class Field(object):
         return None
 
 
+def _compile_validate(field, validate_item):
+    field_class = field.__class__
+
+    def annotate(exc, data, key):
+        exc.set_default_value(data)
+        exc.path.append(key)
+        exc.class_ = field_class
+
+    if field.is_list:
+        def validate(data, key=None):
+            try:
+                if not isinstance(data, collections.Iterable):
+                    raise ValidationError("Is not iterable!")
+                return tuple([validate_item(x) for x in data])
+            except ValidationError as exc:
+                annotate(exc, data, key)
+                raise
+    elif field.is_set:
+        def validate(data, key=None):
+            try:
+                if not isinstance(data, (set, frozenset)):
+                    raise ValidationError("Is not set!")
+                return frozenset([validate_item(x) for x in data])
+            except ValidationError as exc:
+                annotate(exc, data, key)
+                raise
+    else:
+        def validate(data, key=None):
+            try:
+                return validate_item(data)
+            except ValidationError as exc:
+                annotate(exc, data, key)
+                raise
+    return validate
+
+
+def canonical_order(items):
+    """
+    Sort simplified set items; items that do not compare with each other
+    (e.g. nested objects) are ordered by their JSON with sorted keys
+    """
+    try:
+        return sorted(items)
+    except TypeError:
+        return sorted(items, key=_canonical_json)
+
+
+def _canonical_json(item):
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def _compile_serialize(field):
+    simplify = field.simplifier.serialize
+    as_is = field.simplifier is NullSimplifier
+    if field.is_set:
+        # Sorted, so that equal sets serialize the same in every process
+        if as_is:
+            def serialize(data):
+                return None if data is None else tuple(canonical_order(data))
+        else:
+            def serialize(data):
+                return None if data is None else tuple(
+                    canonical_order([simplify(item) for item in data]))
+    elif field.is_list:
+        if as_is:
+            def serialize(data):
+                return None if data is None else tuple(data)
+        else:
+            def serialize(data):
+                return None if data is None else tuple([simplify(item) for item in data])
+    elif as_is:
+        def serialize(data):
+            return data
+    else:
+        def serialize(data):
+            return None if data is None else simplify(data)
+    return serialize
+
+
+def _compile_deserialize(field):
+    unsimplify = field.simplifier.deserialize
+    as_is = field.simplifier is NullSimplifier
+    # Empty values are immutable, so one can be shared
+    empty = field.empty_value()
+    if field.is_list or field.is_set:
+        collection = tuple if field.is_list else frozenset
+        if as_is:
+            def deserialize(serialized):
+                return empty if serialized is None else collection(serialized)
+        else:
+            def deserialize(serialized):
+                if serialized is None:
+                    return empty
+                return collection([unsimplify(item) for item in serialized])
+    elif as_is:
+        def deserialize(serialized):
+            return serialized
+    else:
+        def deserialize(serialized):
+            return None if serialized is None else unsimplify(serialized)
+    return deserialize
+
+
 class FieldAsIs(Field):
     simplifier = staticmethod(NullSimplifier)
 
@@ -131,6 +313,7 @@ class ViewModelField(Field):
     """
     Validator for a specific StrictDict subclass
     """
+    is_internable = False
 
     def __init__(self, class_, *args, **kwargs):
         super(ViewModelField, self).__init__(*args, **kwargs)
@@ -139,10 +322,14 @@ class ViewModelField(Field):
 
     def _validate(self, data):
         if isinstance(data, self.class_):
-            return data
-        if isinstance(data, collections.Mapping):
-            return self.class_(**data)
-        raise ValidationError("Not a valid {}!".format(self.class_))
+            obj = data
+        elif isinstance(data, collections.Mapping):
+            obj = self.class_(**data)
+        else:
+            raise ValidationError("Not a valid {}!".format(self.class_))
+        if obj.is_interned:
+            return obj.intern()
+        return obj
 
 
 class MapField(Field):
@@ -150,6 +337,7 @@ class MapField(Field):
     Validator for a specific StrictDict subclass
     """
     simplifier = staticmethod(NullSimplifier)
+    is_internable = False
 
     def __init__(self, key_field, value_field, *args, **kwargs):
         super(MapField, self).__init__(*args, **kwargs)
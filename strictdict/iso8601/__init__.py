@@ -0,0 +1,70 @@
+"""
+ISO 8601 date/time parsing shared by validators and simplifiers.
+
+Format is detected from length and separator positions in one pass, the
+common fixed-width forms are sliced directly; anything else falls back to
+splitting on separators. Fractions of a second follow strptime's %f: up to
+six digits, '.5' is half a second
+"""
+import datetime as dt
+
+__all__ = ['parse_date', 'parse_time', 'parse_datetime']
+
+
+def _date_parts(s):
+    if len(s) == 10 and s[4] == '-' and s[7] == '-':
+        return int(s[0:4]), int(s[5:7]), int(s[8:10])
+    parts = s.split('-')
+    if len(parts) == 3:
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    raise ValueError('Invalid date format')
+
+
+def _microseconds(fraction):
+    if not 0 < len(fraction) <= 6 or not fraction.isdigit():
+        raise ValueError('Invalid fraction of second')
+    return int(fraction) * 10 ** (6 - len(fraction))
+
+
+def _time_parts(s):
+    length = len(s)
+    if length >= 5 and s[2] == ':':
+        if length == 5:
+            # HH:MM
+            return int(s[0:2]), int(s[3:5]), 0, 0
+        if s[5] == ':':
+            if length == 8:
+                # HH:MM:SS
+                return int(s[0:2]), int(s[3:5]), int(s[6:8]), 0
+            if length > 9 and s[8] == '.':
+                # HH:MM:SS.ffffff
+                return (int(s[0:2]), int(s[3:5]), int(s[6:8]),
+                        _microseconds(s[9:]))
+    parts = s.split(':')
+    if len(parts) == 2:
+        return int(parts[0]), int(parts[1]), 0, 0
+    if len(parts) == 3:
+        seconds, dot, fraction = parts[2].partition('.')
+        return (int(parts[0]), int(parts[1]), int(seconds),
+                _microseconds(fraction) if dot else 0)
+    raise ValueError('Invalid time format')
+
+
+def parse_date(s):
+    return dt.date(*_date_parts(s))
+
+
+def parse_time(s):
+    return dt.time(*_time_parts(s))
+
+
+def parse_datetime(s):
+    """
+    Date and time separated by 'T', with optional trailing 'Z'
+    """
+    date_str, separator, time_str = s.partition('T')
+    if not separator or not time_str:
+        raise ValueError('Invalid datetime format')
+    if time_str[-1] == 'Z':
+        time_str = time_str[:-1]
+    return dt.datetime(*(_date_parts(date_str) + _time_parts(time_str)))
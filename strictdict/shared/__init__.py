@@ -0,0 +1,131 @@
+"""
+Hand-off of StrictDict batches between processes through shared memory.
+
+The producer writes msgpack encodings of a batch into a shared memory
+segment, the consumer attaches to it by name and gets a sequence that
+decodes a record only when it is accessed, straight from the shared buffer.
+
+Segment layout: <uint64 count>, count + 1 uint64 offsets of records
+(the last one is the end of data), then the records back to back.
+
+Needs multiprocessing.shared_memory (Python 3.8+)
+"""
+import collections
+import struct
+
+import msgpack
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    resource_tracker = shared_memory = None
+
+__all__ = ['SharedBatch']
+
+_COUNT = struct.Struct('<Q')
+_OFFSET = struct.Struct('<Q')
+
+
+def _require_shared_memory():
+    if shared_memory is None:
+        raise RuntimeError('SharedBatch requires multiprocessing.shared_memory '
+                           '(Python 3.8+)')
+
+
+def _attach(name):
+    """
+    Open existing segment `name` without handing it to this process'
+    resource tracker, which would unlink it when the process exits, under
+    the producer and other consumers
+    """
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Python < 3.13 registers every opened segment
+        memory = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(memory._name, 'shared_memory')
+        return memory
+
+
+class SharedBatch(collections.Sequence):
+    """
+    Read-only sequence of objects of `class_` stored in the shared memory
+    segment `name`. The process that created the batch with create() is
+    responsible for unlink() once consumers are done with it
+    """
+
+    def __init__(self, class_, name):
+        _require_shared_memory()
+        self.class_ = class_
+        self._memory = _attach(name)
+        self._count = _COUNT.unpack_from(self._memory.buf)[0]
+
+    @classmethod
+    def create(cls, class_, objs):
+        """
+        Write `objs` into a new shared memory segment, return the batch;
+        pass its `name` to consumers
+        """
+        _require_shared_memory()
+        records = [obj.to_string(msg_pack=True) for obj in objs]
+        table_size = _COUNT.size + _OFFSET.size * (len(records) + 1)
+        size = table_size + sum(len(record) for record in records)
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            buf = memory.buf
+            _COUNT.pack_into(buf, 0, len(records))
+            offset = table_size
+            for index, record in enumerate(records):
+                _OFFSET.pack_into(buf, _COUNT.size + index * _OFFSET.size, offset)
+                buf[offset:offset + len(record)] = record
+                offset += len(record)
+            _OFFSET.pack_into(
+                buf, _COUNT.size + len(records) * _OFFSET.size, offset)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+        batch = cls.__new__(cls)
+        batch.class_ = class_
+        batch._memory = memory
+        batch._count = len(records)
+        return batch
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Record index out of range')
+        buf = self._memory.buf
+        start, stop = struct.unpack_from(
+            '<2Q', buf, _COUNT.size + index * _OFFSET.size)
+        with buf[start:stop] as record:
+            data = msgpack.unpackb(record, encoding='utf-8')
+        return self.class_.restore(data)
+
+    def close(self):
+        """
+        Detach from the segment, records already read stay usable
+        """
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Free the segment once every process has closed it
+        """
+        self._memory.unlink()
@@ -6,6 +6,9 @@ perform no checks, so input is supposed to be valid
 """
 import datetime as dt
 import decimal
+import functools
+
+from ..iso8601 import parse_date, parse_datetime, parse_time
 
 
 class NullSimplifier(object):
@@ -42,6 +45,56 @@ def view_model_simplifier(view_model_class):
     return ViewModelSimplifier
 
 
+class InternKey(object):
+    """
+    LRU cache key for `data` that tells apart equal values of different
+    types, and equal Decimals, floats, datetimes and times with different
+    representation ('1.0' and '1.00', 0.0 and -0.0, 12:00 UTC and 13:00
+    UTC+1), which have to be kept
+    """
+    __slots__ = ('data', 'key', 'hash')
+
+    def __init__(self, data):
+        self.data = data
+        if isinstance(data, (decimal.Decimal, float, dt.datetime, dt.time)):
+            self.key = (type(data), repr(data))
+        else:
+            self.key = (type(data), data)
+        # TypeError for unhashable data
+        self.hash = hash(self.key)
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def interned_simplifier(simplifier, maxsize):
+    """
+    Wrap `simplifier`, so that equal simplified values deserialize to one
+    shared object, kept in LRU cache of `maxsize` entries
+    """
+    deserialize = simplifier.deserialize
+    cached = functools.lru_cache(maxsize)(lambda key: deserialize(key.data))
+
+    class InternedSimplifier(object):
+        serialize = staticmethod(simplifier.serialize)
+        cache_info = staticmethod(cached.cache_info)
+        cache_clear = staticmethod(cached.cache_clear)
+
+        @staticmethod
+        def deserialize(data_str):
+            try:
+                key = InternKey(data_str)
+            except TypeError:
+                # Unhashable value
+                return deserialize(data_str)
+            return cached(key)
+
+    return InternedSimplifier
+
+
 class DateSimplifier(object):
     @staticmethod
     def serialize(data):
@@ -49,8 +102,7 @@ class DateSimplifier(object):
 
     @classmethod
     def deserialize(cls, data_str):
-        data = dt.datetime.strptime(data_str, '%Y-%m-%d').date()
-        return data
+        return parse_date(data_str)
 
 
 class DateTimeSimplifier(object):
@@ -60,12 +112,7 @@ class DateTimeSimplifier(object):
 
     @classmethod
     def deserialize(cls, data_str):
-        try:
-            data = dt.datetime.strptime(data_str, '%Y-%m-%dT%H:%M')
-            return data
-        except ValueError:
-            data = dt.datetime.strptime(data_str, '%Y-%m-%dT%H:%M:%SZ')
-            return data
+        return parse_datetime(data_str)
 
 
 class TimeSimplifier(object):
@@ -75,18 +122,10 @@ class TimeSimplifier(object):
 
     @classmethod
     def deserialize(cls, data_str):
-        try:
-            data = dt.datetime.strptime(data_str, '%H:%M').time()
-            return data
-        except ValueError:
-            data = dt.datetime.strptime(data_str, '%H:%M:%S').time()
-            return data
+        return parse_time(data_str)
 
 
 class TimeStampSimplifier(object):
-    DATE_FORMATS = ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f',
-                    '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ']
-
     @staticmethod
     def serialize(data):
         return data.timestamp()
@@ -99,10 +138,4 @@ class TimeStampSimplifier(object):
         if data_str.isalnum():
             data = dt.datetime.fromtimestamp(int(data_str))
             return data
-        for format in cls.DATE_FORMATS:
-            try:
-                data = dt.datetime.strptime(data_str, format)
-                return data
-            except ValueError:
-                pass
-        raise ValueError
+        return parse_datetime(data_str)
@@ -0,0 +1,109 @@
+"""
+Append-only file of msgpack-encoded StrictDicts with random access.
+
+Data file holds records as <uint32 length><msgpack bytes>, index file
+(`path` + '.idx') holds uint64 offsets of records in the data file. Both
+are read through mmap, so opening a store does not read either file and
+fetching a record decodes just that record
+"""
+import mmap
+import os
+import struct
+
+import msgpack
+
+__all__ = ['StrictDictStore']
+
+_LENGTH = struct.Struct('<I')
+_OFFSET = struct.Struct('<Q')
+
+
+class StrictDictStore(object):
+
+    def __init__(self, class_, path):
+        self.class_ = class_
+        self.path = path
+        self.index_path = path + '.idx'
+        self._data_file = open(path, 'ab+')
+        self._index_file = open(self.index_path, 'ab+')
+        self._count = os.fstat(self._index_file.fileno()).st_size // _OFFSET.size
+        # Drop a torn trailing entry of an interrupted append, so that new
+        # entries start at the right offset
+        self._index_file.truncate(self._count * _OFFSET.size)
+        self._data_map = None
+        self._index_map = None
+        # Number of records visible through current maps
+        self._mapped = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Record index out of range')
+        if index >= self._mapped:
+            self._remap()
+        offset = _OFFSET.unpack_from(self._index_map, index * _OFFSET.size)[0]
+        length = _LENGTH.unpack_from(self._data_map, offset)[0]
+        start = offset + _LENGTH.size
+        with memoryview(self._data_map) as view, \
+                view[start:start + length] as record:
+            data = msgpack.unpackb(record, encoding='utf-8')
+        return self.class_.restore(data)
+
+    def append(self, obj):
+        """
+        Add `obj` to the end of the store, return its index
+        """
+        packed = obj.to_string(msg_pack=True)
+        self._data_file.seek(0, os.SEEK_END)
+        offset = self._data_file.tell()
+        self._data_file.write(_LENGTH.pack(len(packed)))
+        self._data_file.write(packed)
+        self._index_file.write(_OFFSET.pack(offset))
+        self._count += 1
+        return self._count - 1
+
+    def extend(self, objs):
+        for obj in objs:
+            self.append(obj)
+
+    def flush(self):
+        self._data_file.flush()
+        self._index_file.flush()
+
+    def close(self):
+        self._unmap()
+        self._data_file.close()
+        self._index_file.close()
+
+    def _unmap(self):
+        for mapped in (self._data_map, self._index_map):
+            if mapped is not None:
+                mapped.close()
+        self._data_map = self._index_map = None
+        self._mapped = 0
+
+    def _remap(self):
+        # Records appended since the last mapping are past its end
+        self.flush()
+        self._unmap()
+        self._data_map = mmap.mmap(
+            self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index_map = mmap.mmap(
+            self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped = self._count
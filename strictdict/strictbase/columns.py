@@ -0,0 +1,92 @@
+"""
+Conversion of StrictDict collections to columns (one array per field) and
+back. NumPy arrays are used when NumPy is installed, array.array/lists
+otherwise
+"""
+import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .. import fields as f
+
+# Field class: (numpy dtype, array.array typecode or None for a list)
+COLUMN_TYPES = [
+    (f.Bool, 'bool', 'b'),
+    (f.Int, 'int64', 'q'),
+    (f.Float, 'float64', 'd'),
+    (f.Date, 'datetime64[D]', None),
+    (f.DateTime, 'datetime64[us]', None),
+    (f.TimeStamp, 'datetime64[us]', None),
+]
+
+
+def column_type(field):
+    """
+    (numpy dtype, array typecode) for values of `field`
+    """
+    if not (field.is_list or field.is_set):
+        for field_class, dtype, typecode in COLUMN_TYPES:
+            if isinstance(field, field_class):
+                return dtype, typecode
+    return 'object', None
+
+
+def to_columns(cls, objs, fields=None):
+    objs = list(objs)
+    if fields is None:
+        fields = list(cls.__fields__)
+    columns = {}
+    for key in fields:
+        field = cls.__fields__[key]
+        # Plain fields are the same in simplified form, so they can be read
+        # from any of the storages without deserializing
+        as_is = field.simplifier is f.NullSimplifier
+        values = []
+        append = values.append
+        has_empty = False
+        for obj in objs:
+            storage = obj._storage
+            if key in storage:
+                value = storage[key]
+            elif as_is and obj._simplified is not None:
+                value = obj._simplified.get(key)
+            else:
+                value = obj._get_item(key)
+            if value is None:
+                has_empty = True
+            append(value)
+
+        dtype, typecode = column_type(field)
+        if has_empty and not dtype.startswith('datetime64'):
+            # Only datetimes have a missing value marker (NaT)
+            dtype, typecode = 'object', None
+        if numpy is not None:
+            column = numpy.empty(len(values), dtype=dtype)
+            if dtype == 'object':
+                # Slice assignment would unpack tuples of list fields
+                for index, value in enumerate(values):
+                    column[index] = value
+            else:
+                column[:] = values
+        elif typecode is not None:
+            column = array.array(typecode, values)
+        else:
+            column = values
+        columns[key] = column
+    return columns
+
+
+def from_columns(cls, columns):
+    keys = list(columns)
+    # tolist() turns numpy scalars and datetime64 back into python objects
+    values = [column.tolist() if hasattr(column, 'tolist') else list(column)
+              for column in columns.values()]
+    records = []
+    for row in zip(*values):
+        records.append({key: value for key, value in zip(keys, row)
+                        if value is not None})
+    objects, _ = cls.from_records(records)
+    return objects
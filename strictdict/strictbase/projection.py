@@ -0,0 +1,99 @@
+"""
+Projections are StrictDict subclasses limited to some of the fields of
+their base (nested objects included), used to load only a part of
+serialized data
+"""
+from ..fields import ViewModelField
+
+# (class, frozen spec): projection class
+_projections = {}
+
+
+def parse_spec(only):
+    """
+    Turn field paths like ['id', 'legs.number'] into nested dict
+    {'id': None, 'legs': {'number': None}}, None meaning the whole field
+    """
+    spec = {}
+    for path in only:
+        node = spec
+        parts = path.split('.')
+        for part in parts[:-1]:
+            if node.get(part, {}) is None:
+                # Whole field is already requested
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return spec
+
+
+def _freeze(spec):
+    return tuple(sorted((key, sub if sub is None else _freeze(sub))
+                        for key, sub in spec.items()))
+
+
+def _thaw(frozen):
+    return {key: sub if sub is None else _thaw(sub) for key, sub in frozen}
+
+
+def restore(cls, frozen, data):
+    """
+    Unpickle an instance of projection of `cls`
+    """
+    return projection(cls, _thaw(frozen)).restore(data)
+
+
+def projection(cls, spec):
+    frozen = _freeze(spec)
+    key = (cls, frozen)
+    try:
+        return _projections[key]
+    except KeyError:
+        pass
+
+    def __reduce__(self):
+        # Projection classes are not reachable by name, so pickles refer
+        # to the class they were made of
+        return restore, (cls, frozen, self.simplify())
+
+    dict_ = {
+        '__module__': cls.__module__,
+        '__ignored_fields__': [name for name in cls.__fields__
+                               if name not in spec],
+        '__reduce__': __reduce__,
+    }
+    for name, sub in spec.items():
+        if name not in cls.__fields__:
+            raise KeyError('No such field: "{}"'.format(name))
+        if sub is None:
+            continue
+        field = cls.__fields__[name]
+        if not isinstance(field, ViewModelField):
+            raise KeyError('Can not project into "{}"'.format(name))
+        dict_[name] = ViewModelField(
+            projection(field.class_, sub), required=field.required,
+            is_list=field.is_list, is_set=field.is_set)
+
+    _projections[key] = projected = type(cls)(
+        '{}Projection'.format(cls.__name__), (cls,), dict_)
+    return projected
+
+
+def project(cls, data, spec):
+    """
+    Drop keys of simplified `data` not requested in `spec`
+    """
+    result = {}
+    for key, sub in spec.items():
+        if key not in data:
+            continue
+        value = data[key]
+        if sub is not None and value is not None:
+            field = cls.__fields__[key]
+            if field.is_list or field.is_set:
+                value = [project(field.class_, item, sub) for item in value]
+            else:
+                value = project(field.class_, value, sub)
+        result[key] = value
+    return result
@@ -1,13 +1,25 @@
 import abc
+import codecs
 import collections
+import concurrent.futures
 import copy
+import hashlib
+import io
 import json
 import msgpack
+import re
+import threading
+import types
+import weakref
 
+from .. import backends
+from . import columns
+from . import projection
 from ..validators import ValidationError
-from ..fields import ViewModelField, Field
+from ..fields import ViewModelField, Field, canonical_order
+from ..simplifiers import NullSimplifier
 
-__ALL__ = ['StrictDict']
+__ALL__ = ['StrictDict', 'Invalid']
 
 
 class StrictDictMeta(abc.ABCMeta):
@@ -23,7 +35,9 @@ class StrictDictMeta(abc.ABCMeta):
 
         for attrname, attr in list(dict_.items()):
             if isinstance(attr, Field):
-                if any(hasattr(base, attrname) for base in bases):
+                if any(hasattr(base, attrname) and not isinstance(
+                        getattr(base, attrname), _FieldDescriptor)
+                       for base in bases):
                     raise NameCollisionError(attrname)
                 fields[attrname] = dict_.pop(attrname)
 
@@ -31,14 +45,262 @@ class StrictDictMeta(abc.ABCMeta):
             fields.pop(ifield, None)
         dict_['__ignored_fields__'] = ignored_fields
         dict_['__fields__'] = fields
-        return super(StrictDictMeta, meta).__new__(meta, name, bases, dict_)
+        for attrname in dict_.get('__order_by__', ()):
+            if attrname not in fields:
+                raise ValueError('__order_by__ names unknown field "{}"'.format(attrname))
+        for attrname in fields:
+            # Methods and properties of the class itself win, as they did
+            # over __getattr__
+            if attrname not in dict_:
+                dict_[attrname] = _FieldDescriptor(attrname)
+        if '__slots__' not in dict_ and _lookup(bases, dict_, 'is_compact'):
+            # Instance state lives in the slots declared by StrictDict,
+            # so compact classes need no per-instance __dict__
+            dict_['__slots__'] = ()
+        cls = super(StrictDictMeta, meta).__new__(meta, name, bases, dict_)
+        if '__init__' not in dict_ and (
+                cls.__init__ is StrictDict.__init__ or
+                hasattr(cls.__init__, '__compiled_for__')):
+            # No custom constructor anywhere in the hierarchy: replace the
+            # generic one with a version specialized for this field set
+            if cls.is_compiled_init:
+                cls.__init__ = _compile_init(cls)
+            else:
+                cls.__init__ = StrictDict.__init__
+        # Shared instances of this class by canonical encoding, see intern()
+        cls._intern_table = weakref.WeakValueDictionary()
+        return cls
+
+
+_intern_lock = threading.Lock()
+
+
+def _lookup(bases, dict_, name, default=False):
+    """
+    Resolve class attribute `name` of a class that is not created yet
+    """
+    if name in dict_:
+        return dict_[name]
+    for base in bases:
+        if hasattr(base, name):
+            return getattr(base, name)
+    return default
+
+
+def _compile_init(cls):
+    """
+    Build __init__ with everything that depends only on the class (field
+    order, flags, empty checks) resolved once. Validators and serializers
+    are looked up on fields per call, as fields recompile them when their
+    simplifier is replaced. Behaviour is the same as StrictDict.__init__,
+    which is kept as the generic fallback
+    """
+    field_names = frozenset(cls.__fields__)
+    ignored_fields = frozenset(cls.__ignored_fields__)
+    is_ignore_unknown_fields = cls.is_ignore_unknown_fields
+    is_lazy_simplify = cls.is_lazy_simplify
+    generic_init = StrictDict.__init__
+    specs = []
+    for key, field in cls.__fields__.items():
+        # None means default Field.is_empty, i.e. plain `value is None`
+        is_empty = field.is_empty
+        if type(field).is_empty is Field.is_empty:
+            is_empty = None
+        required = None
+        if field.required:
+            required = 'Required field {} is empty or missing!'.format(key)
+        specs.append((key, required, is_empty, field.empty_value, field))
+    specs = tuple(specs)
+
+    def __init__(self, **kwargs):
+        if self.__class__ is not cls:
+            # Called via super() from a subclass with its own fields
+            return generic_init(self, **kwargs)
+        invalid = populate(self, kwargs)
+        if invalid is not None:
+            raise invalid.exception()
+
+    def populate(self, kwargs):
+        """
+        Validate `kwargs` into self, return Invalid if they are rejected
+        """
+        storage = {}
+        simplified = {}
+        present = []
+        _errors = None
+        for key, required, is_empty, empty_value, field in specs:
+            value = kwargs.get(key)
+            if value is None if is_empty is None else is_empty(value):
+                if required:
+                    if _errors is None:
+                        _errors = []
+                    _errors.append({key: required})
+                elif _errors is None:
+                    storage[key] = empty_value()
+                continue
+            try:
+                validated = field.validate(value, key)
+            except ValidationError as exc:
+                if _errors is None:
+                    _errors = []
+                _errors.append({key: exc.errors or exc.message})
+                continue
+            if _errors is None:
+                storage[key] = validated
+                if is_lazy_simplify:
+                    present.append(key)
+                else:
+                    simplified[key] = field.serialize(validated)
+
+        if _errors:
+            return Invalid(cls, kwargs, errors=_errors)
+
+        if not is_ignore_unknown_fields and not kwargs.keys() <= field_names:
+            extra_keys = kwargs.keys() - field_names - ignored_fields
+            if extra_keys:
+                return Invalid(cls, kwargs, extra_keys=extra_keys)
+
+        object.__setattr__(self, '_storage', storage)
+        if is_lazy_simplify:
+            object.__setattr__(self, '_simplified', None)
+            object.__setattr__(self, '_present', tuple(present))
+        else:
+            object.__setattr__(self, '_simplified', simplified)
+
+    __init__.__compiled_for__ = cls
+    __init__.populate = populate
+    __init__.__qualname__ = '{}.__init__'.format(cls.__qualname__)
+    return __init__
+
+
+class Invalid(object):
+    """
+    Compact record of data rejected by StrictDict.try_create()/check().
+    Message and field paths are only rendered when asked for
+    """
+    __slots__ = ('class_', 'value', 'errors', 'extra_keys', '_exception')
+
+    def __init__(self, class_, value, errors=None, extra_keys=None):
+        self.class_ = class_
+        self.value = value
+        self.errors = errors or []
+        self.extra_keys = extra_keys or set()
+        self._exception = None
+
+    def __repr__(self):
+        return '<Invalid {}: {}>'.format(self.class_.__name__, self.message)
+
+    @property
+    def paths(self):
+        """
+        Dotted paths of rejected fields and names of unknown ones
+        """
+        return _format_error(self.errors) + sorted(str(x) for x in self.extra_keys)
+
+    @property
+    def message(self):
+        if self._exception is not None:
+            return self._exception.message
+        if self.errors:
+            return 'ValidationError in fields: {}'.format(', '.join(_format_error(self.errors)))
+        return 'No such fields: {}'.format(', '.join(str(x) for x in self.extra_keys))
+
+    def exception(self):
+        """
+        ValidationError the constructor raises for the same data
+        """
+        if self._exception is not None:
+            return self._exception
+        if self.errors:
+            return ValidationError(lambda: self.message, class_=self.class_, path=[],
+                                   value=self.value, errors=self.errors)
+        return ValidationError(lambda: self.message, class_=self.class_)
+
+    @classmethod
+    def from_exception(cls, class_, exc):
+        invalid = cls(class_, exc.value, errors=exc.errors)
+        invalid._exception = exc
+        return invalid
+
+
+def _format_error(errors, prefix=''):
+    fields = []
+    for error in errors:
+        for key, value in error.items():
+            if isinstance(value, list):
+                fields.extend(_format_error(errors=value, prefix=key))
+            else:
+                if prefix:
+                    key = '{0}.{1}'.format(prefix, key)
+                fields.append(key)
+    return fields
+
+
+class _FieldDescriptor(object):
+    """
+    Attribute access to a field, installed by StrictDictMeta. Values that
+    are ready are read straight from storage; everything else (values to
+    deserialize, missing and ignored fields) goes through _get_item()
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return obj._storage[self.key]
+        except KeyError:
+            return obj._get_item(self.key)
+
+    def __set__(self, obj, value):
+        raise AttributeError("Object is immutable")
+
+    def __delete__(self, obj):
+        raise AttributeError("Object is immutable")
+
+
+class _ItemsView(collections.ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        obj = self._mapping
+        storage = obj._storage
+        for key in obj:
+            try:
+                value = storage[key]
+            except KeyError:
+                value = obj._get_item(key)
+            yield key, value
+
+
+class _ValuesView(collections.ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        obj = self._mapping
+        storage = obj._storage
+        for key in obj:
+            try:
+                value = storage[key]
+            except KeyError:
+                value = obj._get_item(key)
+            yield value
 
 
 class _StrictDictInterface(collections.MutableMapping):
+    __slots__ = ()
+
     def __repr__(self):
         return self.to_string()
 
     def __getitem__(self, key):
+        try:
+            return self._storage[key]
+        except (KeyError, TypeError):
+            pass
         try:
             return self._get_item(key)
         except AttributeError:
@@ -47,7 +309,9 @@ class _StrictDictInterface(collections.MutableMapping):
     def __contains__(self, key):
         if key not in self.__fields__:
             return False
-        return key in self._storage or key in self._simplified
+        if key in self._storage:
+            return True
+        return key in self._keys()
 
     def __setitem__(self, key, value):
         raise AttributeError("Object is immutable")
@@ -68,31 +332,145 @@ class _StrictDictInterface(collections.MutableMapping):
         return len(self._keys())
 
     def __iter__(self):
+        fields = self.__fields__
         for key in self._keys():
-            if key in self:
+            # Restored data may carry keys of ignored fields
+            if key in fields:
                 yield key
 
+    def keys(self):
+        return collections.KeysView(self)
+
+    def items(self):
+        return _ItemsView(self)
+
+    def values(self):
+        return _ValuesView(self)
+
+    def simplified_view(self):
+        """
+        Read-only mapping of simplified values, the same data dumps()
+        encodes. Nothing is deserialized, so code that only passes values on
+        can skip building them
+        """
+        return types.MappingProxyType(self.simplify())
+
+    def raw_items(self):
+        """
+        (key, simplified value) pairs, see simplified_view()
+        """
+        return self.simplified_view().items()
+
+    def __reduce__(self):
+        # Ship only simplified data, it is restored without validation
+        return _restore, (self.__class__, self.simplify())
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__ or \
+                self._simplified is None or other._simplified is None:
+            # Lazy objects have their values at hand anyway
+            return super(_StrictDictInterface, self).__eq__(other)
+        simplified = self._simplified
+        other_simplified = other._simplified
+        if simplified == other_simplified:
+            return True
+        if simplified.keys() != other_simplified.keys():
+            # Restored data may carry keys of ignored fields
+            return super(_StrictDictInterface, self).__eq__(other)
+        fields = self.__fields__
+        for key, value in simplified.items():
+            # Same value may be simplified differently (tuple and list,
+            # Decimal('1.0') and Decimal('1.00')), only then deserialize
+            if key in fields and value != other_simplified[key] and \
+                    self._get_item(key) != other._get_item(key):
+                return False
+        return True
+
+    def __lt__(self, other):
+        if not self.__order_by__ or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    def __le__(self, other):
+        if not self.__order_by__ or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() <= other._sort_key()
+
+    def __gt__(self, other):
+        if not self.__order_by__ or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() > other._sort_key()
+
+    def __ge__(self, other):
+        if not self.__order_by__ or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() >= other._sort_key()
+
     def __hash__(self):
-        return hash(self.to_string(msg_pack=True))
+        cache = self._get_cache()
+        if cache is None:
+            return hash(self._dump(msg_pack=True))
+        try:
+            return cache['hash']
+        except KeyError:
+            cache['hash'] = value = hash(self._dump(msg_pack=True))
+            return value
 
 
 class StrictDict(_StrictDictInterface, metaclass=StrictDictMeta):
     """
     Provides dict interface with validation and serialization/deserialization
+
+    Instances can be shared between threads without locking. Values are
+    filled in lazily (deserialized fields, simplified form, memoized
+    encodings), and concurrent readers may compute one of them more than
+    once, but they never see it half-built. Every reader of a field gets
+    the same value object, and reads of values that are ready take no lock
     """
+    __slots__ = ('_storage', '_simplified', '_present', '_cache',
+                 '__weakref__')
     __fields__ = {}
     __ignored_fields__ = ()
+    # Field names objects are ordered by, no ordering if empty
+    __order_by__ = ()
     is_ignore_unknown_fields = False
+    # Set to False to construct instances with the generic (slower, but
+    # easier to step through) __init__ below
+    is_compiled_init = True
+    # Serialize fields on first simplify()/dumps() instead of in __init__
+    is_lazy_simplify = False
+    # Give subclasses empty __slots__, so instances carry no __dict__
+    is_compact = False
+    # Keep hash and dumps() output on the instance after first computation.
+    # Turn off for memory-sensitive use
+    is_memoize = True
+    # Name of JSON backend used by dumps()/loads(), None for the default
+    # one (see strictdict.backends)
+    json_backend = None
+    # Encode with keys of objects and maps sorted, so that equal objects
+    # give byte-identical dumps() in every process. hash() is still salted
+    # per process (PYTHONHASHSEED), use content_id() for keys shared
+    # between processes
+    is_canonical = False
+    # Share one instance between equal nested objects and restored ones,
+    # see intern()
+    is_interned = False
 
     def __init__(self, **kwargs):
         if self.is_ignore_unknown_fields:
             # Silently swallow all extra keys
             kwargs = {k: v for k, v in kwargs.items() if k in self.__fields__.keys()}
 
+        lazy = self.is_lazy_simplify
         # Underlying python dict
         self._direct_set('_storage', dict())
-        # Simplified storage ready to be serialized
-        self._direct_set('_simplified', dict())
+        # Simplified storage ready to be serialized, built by simplify()
+        # in lazy mode
+        self._direct_set('_simplified', None if lazy else dict())
+        # Keys that have non-empty values, used while _simplified is unset
+        present = []
         full_kwargs = kwargs
         kwargs = kwargs.copy()
         _errors = []
@@ -119,34 +497,217 @@ class StrictDict(_StrictDictInterface, metaclass=StrictDictMeta):
             if not _errors:
                 self._storage[key] = validated
                 if not value_is_empty:
-                    self._simplified[key] = field.serialize(validated)
+                    if lazy:
+                        present.append(key)
+                    else:
+                        self._simplified[key] = field.serialize(validated)
 
         if _errors:
-            msg = 'ValidationError in fields: {}'.format(', '.join(self._format_error(_errors)))
-            exc = ValidationError(msg, class_=self.__class__, path=[], value=full_kwargs, errors=_errors)
-            raise exc
+            raise Invalid(self.__class__, full_kwargs, errors=_errors).exception()
 
         extra_keys = set(kwargs.keys()) - set(self.__ignored_fields__)
         if extra_keys:
-            raise ValidationError('No such fields: {}'.format(', '.join(str(x) for x in extra_keys)),
-                                  class_=self.__class__)
+            raise Invalid(self.__class__, full_kwargs, extra_keys=extra_keys).exception()
+
+        if lazy:
+            self._direct_set('_present', tuple(present))
+
+    @classmethod
+    def from_records(cls, records, errors='raise'):
+        """
+        Create objects from an iterable of mappings, same as calling
+        cls(**record) for each of them, but without per-record setup.
+        Returns (objects, report), report is a list of
+        (index, ValidationError) for rejected records. With errors='raise'
+        the first failure is raised, 'collect' puts None in place of
+        rejected objects and 'skip' leaves them out
+        """
+        if errors not in ('raise', 'collect', 'skip'):
+            raise ValueError('errors must be one of raise, collect, skip')
+        populate = None
+        if getattr(cls.__init__, '__compiled_for__', None) is cls:
+            populate = cls.__init__.populate
+        new = cls.__new__
+        objects = []
+        append = objects.append
+        report = []
+        for index, record in enumerate(records):
+            if populate is None:
+                try:
+                    obj = cls(**record)
+                except ValidationError as exc:
+                    obj = Invalid.from_exception(cls, exc)
+            else:
+                if type(record) is not dict:
+                    # populate() needs dict.get() and set-like keys()
+                    record = dict(record)
+                obj = new(cls)
+                invalid = populate(obj, record)
+                if invalid is not None:
+                    obj = invalid
+            if obj.__class__ is Invalid:
+                if errors == 'raise':
+                    raise obj.exception()
+                report.append((index, obj.exception()))
+                if errors == 'collect':
+                    append(None)
+                continue
+            append(obj)
+        return objects, report
+
+    @classmethod
+    def try_create(cls, **kwargs):
+        """
+        Same as cls(**kwargs), but returns Invalid instead of raising
+        ValidationError when data is rejected
+        """
+        if getattr(cls.__init__, '__compiled_for__', None) is not cls:
+            try:
+                return cls(**kwargs)
+            except ValidationError as exc:
+                return Invalid.from_exception(cls, exc)
+        obj = cls.__new__(cls)
+        invalid = cls.__init__.populate(obj, kwargs)
+        if invalid is not None:
+            return invalid
+        return obj
+
+    @classmethod
+    def check(cls, **kwargs):
+        """
+        Validate kwargs, return Invalid if they are rejected, None otherwise
+        """
+        result = cls.try_create(**kwargs)
+        if result.__class__ is Invalid:
+            return result
+        return None
+
+    @classmethod
+    def validate_parallel(cls, records, workers=None, chunksize=1000,
+                          errors='raise'):
+        """
+        from_records() spread over a pool of `workers` processes, records
+        are sent in chunks of `chunksize`. Objects come back in order, in
+        simplified form. Class has to be importable by the workers
+        """
+        if errors not in ('raise', 'collect', 'skip'):
+            raise ValueError('errors must be one of raise, collect, skip')
+        chunks = []
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunksize:
+                chunks.append(chunk)
+                chunk = []
+        if chunk:
+            chunks.append(chunk)
+
+        objects = []
+        report = []
+        offset = 0
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            results = executor.map(_from_records, [cls] * len(chunks),
+                                   chunks, [errors] * len(chunks))
+            for chunk, (chunk_objects, chunk_report) in zip(chunks, results):
+                objects.extend(chunk_objects)
+                report.extend((offset + index, exc) for index, exc in chunk_report)
+                offset += len(chunk)
+        return objects, report
+
+    @classmethod
+    def to_columns(cls, objs, fields=None):
+        """
+        Dict of field name: array of the field's values over `objs`.
+        Bool, Int and Float fields become bool, int64 and float64 arrays,
+        Date, DateTime and TimeStamp become datetime64, anything else
+        (and numeric columns with missing values) has object dtype.
+        Without NumPy numeric columns are array.array and the rest lists
+        """
+        return columns.to_columns(cls, objs, fields)
+
+    @classmethod
+    def from_columns(cls, data):
+        """
+        Inverse of to_columns(): validate rows of `data` into objects
+        """
+        return columns.from_columns(cls, data)
 
     def _direct_set(self, key, value):
         object.__setattr__(self, key, value)
 
+    def _get_cache(self):
+        if not self.is_memoize:
+            return None
+        try:
+            return self._cache
+        except AttributeError:
+            cache = {}
+            self._direct_set('_cache', cache)
+            return cache
+
+    def _dump(self, msg_pack, as_bytes=False, canonical=None):
+        if msg_pack:
+            format = 'msgpack'
+        elif as_bytes:
+            format = 'json_bytes'
+        else:
+            format = 'json'
+        if canonical is None:
+            canonical = self.is_canonical
+        key = format + '_canonical' if canonical else format
+        cache = self._get_cache()
+        if cache is not None:
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+        data = self.simplify()
+        if canonical:
+            data = _canonical(self.__class__, data)
+        value = _encode(data, format, self.json_backend)
+        if cache is not None:
+            cache[key] = value
+        return value
+
+    def content_id(self):
+        """
+        Hex SHA-256 digest of canonical msgpack encoding: the same for
+        equal objects in every process, whatever is_canonical is set to.
+        Unlike hash(), fit for cache and dedup keys shared between processes
+        """
+        cache = self._get_cache()
+        if cache is not None:
+            try:
+                return cache['content_id']
+            except KeyError:
+                pass
+        value = hashlib.sha256(
+            self._dump(msg_pack=True, canonical=True)).hexdigest()
+        if cache is not None:
+            cache['content_id'] = value
+        return value
+
     def _format_error(self, errors, prefix=''):
-        fields = []
-        for error in errors:
-            for key, value in error.items():
-                if isinstance(value, list):
-                    fields.extend(self._format_error(errors=value, prefix=key))
-                else:
-                    if prefix:
-                        key = '{0}.{1}'.format(prefix, key)
-                    fields.append(key)
-        return fields
+        return _format_error(errors, prefix)
+
+    def _sort_key(self):
+        simplified = self._simplified
+        key = []
+        for name in self.__order_by__:
+            field = self.__fields__[name]
+            # Simplified form orders the same way for plain scalar values
+            if simplified is not None and field.simplifier is NullSimplifier and \
+                    not (field.is_list or field.is_set):
+                value = simplified.get(name)
+            else:
+                value = self._get_item(name)
+            # Missing values go first, without comparing None to values
+            key.append((0,) if value is None else (1, value))
+        return tuple(key)
 
     def _keys(self):
+        if self._simplified is None:
+            return self._present
         return self._simplified.keys()
 
     def _get_item(self, key):
@@ -156,20 +717,33 @@ class StrictDict(_StrictDictInterface, metaclass=StrictDictMeta):
         except KeyError:
             raise AttributeError('No such field: "%s"' % key)
 
-        if key in self._storage:
+        storage = self._storage
+        try:
             # Value is ready
-            return self._storage[key]
-        if key in self._simplified:
+            return storage[key]
+        except KeyError:
+            pass
+        simplified = self._simplified
+        if simplified is not None and key in simplified:
             # Value is in simplified form
-            val_simpl = self._simplified[key]
-            value = field.deserialize(val_simpl)
-            self._storage[key] = value
-            return value
-        self._storage[key] = value = field.empty_value()
-        return value
+            value = field.deserialize(simplified[key])
+        else:
+            value = field.empty_value()
+        # Threads racing to materialize the same field may each deserialize
+        # it, but only the first value gets published and all of them
+        # return that one
+        return storage.setdefault(key, value)
 
     def simplify(self):
-        return self._simplified
+        simplified = self._simplified
+        if simplified is None:
+            # Concurrent first calls may build equal dicts; the last one
+            # built stays on the object
+            storage = self._storage
+            simplified = {key: self.__fields__[key].serialize(storage[key])
+                          for key in self._present}
+            self._direct_set('_simplified', simplified)
+        return simplified
 
     def to_dict(self):
         """
@@ -194,51 +768,337 @@ class StrictDict(_StrictDictInterface, metaclass=StrictDictMeta):
         return plain_dict
 
     @classmethod
-    def restore(cls, data_dict):
+    def restore(cls, data_dict, only=None):
         """
         Restore from previously simplified data. Data is supposed to be valid,
         no checks are performed!
+        With `only` (list of field paths like 'legs.number') an instance of
+        projection(only) is restored from the requested part of data
         """
+        if only is not None:
+            spec = projection.parse_spec(only)
+            return projection.projection(cls, spec).restore(
+                projection.project(cls, data_dict, spec))
         obj = cls.__new__(cls)  # Avoid calling constructor
         object.__setattr__(obj, '_simplified', data_dict)
         object.__setattr__(obj, '_storage', dict())
+        if cls.is_interned:
+            return obj.intern()
         return obj
 
-    def to_string(self, msg_pack=False):
-        return self.dumps(self, msg_pack=msg_pack)
+    def intern(self):
+        """
+        Return the instance of this class shared by all objects equal to
+        this one (this one if there is none yet). Instances are keyed by
+        canonical encoding and only weakly referenced, so the shared one
+        lives as long as someone else holds it
+        """
+        key = self._dump(msg_pack=True, canonical=True)
+        # WeakValueDictionary.setdefault is not atomic
+        with _intern_lock:
+            return self.__class__._intern_table.setdefault(key, self)
+
+    def to_string(self, msg_pack=False, as_bytes=False):
+        return self.dumps(self, msg_pack=msg_pack, as_bytes=as_bytes)
 
     @classmethod
-    def dumps(cls, data, msg_pack=False):
+    def dumps(cls, data, msg_pack=False, as_bytes=False):
+        """
+        Encode object or list of objects as JSON or msgpack. JSON is
+        returned as str, or as utf-8 bytes with `as_bytes`
+        """
         if isinstance(data, (list, tuple,)):
-            data = [d.simplify() for d in data]
-        else:
-            data = data.simplify()
-
-        if msg_pack:
-            return msgpack.dumps(data)
-        kw = {}
-        return json.dumps(data, **kw)
+            # Same data as encoding the list of simplified dicts, but
+            # reuses encodings memoized on the items
+            if msg_pack:
+                return msgpack.Packer().pack_array_header(len(data)) + \
+                    b''.join(d._dump(msg_pack) for d in data)
+            separator = backends.get_backend(cls.json_backend).separator
+            if as_bytes:
+                return b'[' + separator.encode('utf-8').join(
+                    d._dump(msg_pack, as_bytes) for d in data) + b']'
+            return '[{}]'.format(separator.join(d._dump(msg_pack) for d in data))
+        return data._dump(msg_pack, as_bytes)
 
     @classmethod
-    def loads(cls, data_str, msg_pack=False):
+    def loads(cls, data_str, msg_pack=False, only=None):
         if msg_pack:
             if isinstance(data_str, bytes):
                 data = msgpack.loads(data_str, encoding='utf-8')
             else:
                 data = msgpack.loads(data_str)
         else:
-            data = json.loads(data_str)
+            data = backends.get_backend(cls.json_backend).loads(data_str)
+
+        if only is not None:
+            # Resolve projection once for all items
+            spec = projection.parse_spec(only)
+            projected = projection.projection(cls, spec)
+            if isinstance(data, (list, tuple,)):
+                return [projected.restore(projection.project(cls, d, spec))
+                        for d in data]
+            return projected.restore(projection.project(cls, data, spec))
 
         if isinstance(data, (list, tuple,)):
             return [cls.restore(d) for d in data]
         return cls.restore(data)
 
+    @classmethod
+    def projection(cls, only):
+        """
+        Subclass having only fields listed in `only`, nested fields are
+        given as dotted paths: ['age', 'legs.number']
+        """
+        return projection.projection(cls, projection.parse_spec(only))
+
+    @classmethod
+    def iter_loads(cls, data, chunk_size=65536):
+        """
+        Iterate over objects of a single top-level JSON array, decoding it
+        element by element. `data` is a file (text or binary) or a
+        str/bytes buffer; memory use is bounded by the largest element.
+        Always uses stdlib json, since it needs JSONDecoder.raw_decode
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = io.BytesIO(data)
+        elif isinstance(data, str):
+            data = io.StringIO(data)
+        for item in _iter_json_array(data, chunk_size):
+            yield cls.restore(item)
+
+    @classmethod
+    def dump_stream(cls, data, fileobj, msg_pack=False):
+        """
+        Write objects from iterable `data` to `fileobj` one at a time:
+        newline-delimited JSON or concatenated msgpack. JSON may go to
+        a text or binary file, msgpack needs a binary one.
+        Returns number of objects written
+        """
+        as_bytes = not isinstance(fileobj, io.TextIOBase)
+        newline = b'\n' if as_bytes else '\n'
+        count = 0
+        for obj in data:
+            encoded = obj._dump(msg_pack, as_bytes)
+            if not msg_pack:
+                encoded += newline
+            fileobj.write(encoded)
+            count += 1
+        return count
+
+    @classmethod
+    def load_stream(cls, fileobj, msg_pack=False):
+        """
+        Iterate over objects written by dump_stream(), restoring them one
+        at a time
+        """
+        if msg_pack:
+            for data in msgpack.Unpacker(fileobj, encoding='utf-8'):
+                yield cls.restore(data)
+            return
+        loads = backends.get_backend(cls.json_backend).loads
+        for line in fileobj:
+            if line.strip():
+                yield cls.restore(loads(line))
+
     def clone(self):
         """
         Return a deep copy of self
         """
         return self.restore(self.simplify())
 
+    def evolve(self, **changes):
+        """
+        Return a copy of self with fields from `changes` replaced. Only the
+        changed fields are validated, values of the rest (nested objects
+        included) are shared with self. Constructor is not called
+        """
+        cls = self.__class__
+        fields = self.__fields__
+        extra_keys = changes.keys() - fields.keys()
+        if extra_keys:
+            if not cls.is_ignore_unknown_fields:
+                extra_keys -= set(cls.__ignored_fields__)
+                if extra_keys:
+                    raise Invalid(cls, changes, extra_keys=extra_keys).exception()
+            changes = {k: v for k, v in changes.items() if k in fields}
+
+        lazy = self._simplified is None
+        storage = dict(self._storage)
+        if lazy:
+            present = set(self._present)
+        else:
+            simplified = dict(self._simplified)
+        _errors = []
+        for key, value in changes.items():
+            field = fields[key]
+            if field.is_empty(value):
+                if field.required:
+                    _errors.append({key: 'Required field {} is empty or missing!'.format(key)})
+                    continue
+                storage[key] = field.empty_value()
+                if lazy:
+                    present.discard(key)
+                else:
+                    simplified.pop(key, None)
+                continue
+            try:
+                validated = field.validate(value, key)
+            except ValidationError as exc:
+                _errors.append({key: exc.errors or exc.message})
+                continue
+            storage[key] = validated
+            if lazy:
+                present.add(key)
+            else:
+                simplified[key] = field.serialize(validated)
+
+        if _errors:
+            raise Invalid(cls, changes, errors=_errors).exception()
+
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, '_storage', storage)
+        if lazy:
+            object.__setattr__(obj, '_simplified', None)
+            object.__setattr__(obj, '_present', tuple(k for k in fields if k in present))
+        else:
+            object.__setattr__(obj, '_simplified', simplified)
+        return obj
+
+    def evolve_path(self, path, value):
+        """
+        evolve() for a nested field: `path` is dot-separated field names,
+        with item indexes for list fields, e.g. 'legs.3.name'
+        """
+        key, _, rest = path.partition('.')
+        if not rest:
+            return self.evolve(**{key: value})
+        child = self[key]
+        if self.__fields__[key].is_list:
+            index, _, rest = rest.partition('.')
+            items = list(child)
+            try:
+                index = int(index)
+                items[index] = items[index].evolve_path(rest, value) if rest else value
+            except (ValueError, IndexError):
+                raise KeyError('No item {} in "{}"'.format(index, key))
+            return self.evolve(**{key: items})
+        if not isinstance(child, StrictDict):
+            raise KeyError('Can not descend into "{}"'.format(key))
+        return self.evolve(**{key: child.evolve_path(rest, value)})
+
+
+def _restore(cls, data):
+    return cls.restore(data)
+
+
+def _from_records(cls, records, errors):
+    return cls.from_records(records, errors)
+
+
+def _canonical(cls, data):
+    """
+    Copy of simplified `data` of `cls` with keys of all dicts and items of
+    set fields in sorted order. restore() keeps set items in the order they
+    came in, so sets are sorted here as well as in serialize()
+    """
+    result = collections.OrderedDict()
+    for key in canonical_order(data):
+        value = data[key]
+        field = cls.__fields__.get(key)
+        if value is not None and isinstance(field, ViewModelField):
+            if field.is_list or field.is_set:
+                value = [_canonical(field.class_, item) for item in value]
+            else:
+                value = _canonical(field.class_, value)
+        else:
+            value = _canonical_value(value)
+        if field is not None and field.is_set and value is not None:
+            value = canonical_order(value)
+        result[key] = value
+    return result
+
+
+def _canonical_value(data):
+    if isinstance(data, dict):
+        return collections.OrderedDict(
+            (key, _canonical_value(data[key])) for key in canonical_order(data))
+    if isinstance(data, (list, tuple)):
+        return [_canonical_value(item) for item in data]
+    return data
+
+
+def _encode(data, format, json_backend=None):
+    if format == 'msgpack':
+        return msgpack.dumps(data)
+    if format == 'json_bytes':
+        return backends.get_backend(json_backend).dumps_bytes(data)
+    return backends.get_backend(json_backend).dumps(data)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_json_array(fileobj, chunk_size):
+    """
+    Yield decoded elements of the JSON array read from `fileobj`, keeping
+    only the undecoded tail of the input in memory
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    pos = 0
+    eof = False
+    state = 'start'
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos < len(buf) and state == 'value':
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+                end = None
+            # A value running up to the end of the buffer may be cut short
+            if end is not None and (end < len(buf) or eof):
+                yield item
+                pos = end
+                state = 'separator'
+                continue
+        elif pos < len(buf):
+            char = buf[pos]
+            pos += 1
+            if state == 'start' and char == '[':
+                state = 'first'
+                continue
+            if state == 'first' and char == ']' or \
+                    state == 'separator' and char == ']':
+                # Only whitespace may follow, up to the end of input
+                state = 'end'
+                continue
+            if state == 'end':
+                raise ValueError('Extra data after JSON array')
+            if state == 'first':
+                pos -= 1
+                state = 'value'
+                continue
+            if state == 'separator' and char == ',':
+                state = 'value'
+                continue
+            raise ValueError('Unexpected {!r} in JSON array'.format(char))
+
+        if eof:
+            if state == 'end':
+                return
+            raise ValueError('Unexpected end of JSON array')
+        # Read at least as much as is buffered, so that retrying
+        # an element spanning many chunks stays linear
+        chunk = fileobj.read(max(chunk_size, len(buf) - pos))
+        eof = not chunk
+        if isinstance(chunk, bytes):
+            chunk = text_decoder.decode(chunk, final=eof)
+        buf = buf[pos:] + chunk
+        pos = 0
+
 
 class NameCollisionError(Exception):
     pass
@@ -0,0 +1,161 @@
+# coding: utf-8
+"""
+Every JSON backend has to round-trip all field types the same way
+"""
+import datetime as dt
+import json
+import math
+from decimal import Decimal
+
+import pytest
+
+from strictdict import StrictDict, backends
+from strictdict import fields as f
+from strictdict import api
+
+
+class Inner(StrictDict):
+    name = f.String()
+    price = f.Decimal()
+
+
+class Everything(StrictDict):
+    flag = f.Bool()
+    number = f.Int()
+    ratio = f.Float()
+    name = f.String()
+    price = f.Decimal()
+    date = f.Date()
+    datetime = f.DateTime()
+    time = f.Time()
+    timestamp = f.TimeStamp()
+    tags = api.sset(f.String)
+    numbers = api.slist(f.Int)
+    mapping = api.ref(f.MapField, api.ref(f.String), api.slist(f.Int))
+    flags = api.ref(f.MapField, api.ref(f.Bool), api.ref(f.Int))
+    inner = f.ViewModelField(Inner)
+    inners = f.ViewModelField(Inner, is_list=True)
+    missing = f.String(required=False)
+
+
+@pytest.fixture(params=backends.PREFERENCE)
+def backend(request):
+    if request.param not in backends.available_backends():
+        pytest.skip('{} is not installed'.format(request.param))
+
+    class Model(Everything):
+        json_backend = request.param
+
+    return Model
+
+
+@pytest.fixture
+def everything(backend):
+    return backend(
+        flag=True, number=-42, ratio=0.1, name=u"Любимая нога /\"\\",
+        price='123.4500', date='2013-07-08', datetime='2013-11-18T10:11',
+        time='10:11', timestamp=1500000000.25, tags={'a', 'b'},
+        numbers=[1, 2, 3], mapping={'k1': [], 'k2': [1, 2]},
+        flags={True: 1, False: 0},
+        inner={'name': 'i', 'price': 1}, inners=[{'name': 'j', 'price': '2.5'}])
+
+
+def check(obj):
+    assert obj.flag is True
+    assert obj.number == -42
+    assert obj.ratio == 0.1
+    assert obj.name == u"Любимая нога /\"\\"
+    assert obj.price == Decimal('123.4500')
+    assert obj.date == dt.date(2013, 7, 8)
+    assert obj.datetime == dt.datetime(2013, 11, 18, 10, 11)
+    assert obj.time == dt.time(10, 11)
+    assert obj.timestamp == dt.datetime.fromtimestamp(1500000000.25)
+    assert obj.tags == frozenset(['a', 'b'])
+    assert obj.numbers == (1, 2, 3)
+    assert obj.mapping == {'k1': [], 'k2': [1, 2]}
+    # Keys are written the stdlib way
+    assert obj.flags == {'true': 1, 'false': 0}
+    assert obj.inner.price == Decimal(1)
+    assert obj.inners[0].price == Decimal('2.5')
+    assert obj.missing is None
+
+
+def test_round_trip(backend, everything):
+    for as_bytes in (False, True):
+        dump = everything.to_string(as_bytes=as_bytes)
+        assert isinstance(dump, bytes if as_bytes else str)
+        check(backend.loads(dump))
+
+
+def test_list_round_trip(backend, everything):
+    for as_bytes in (False, True):
+        dump = backend.dumps([everything, everything], as_bytes=as_bytes)
+        assert isinstance(dump, bytes if as_bytes else str)
+        restored = backend.loads(dump)
+        assert len(restored) == 2
+        check(restored[1])
+
+
+def test_backends_are_interchangeable(everything):
+    dump = everything.to_string()
+    for name in backends.available_backends():
+        assert backends.get_backend(name).loads(dump) == \
+            backends.get_backend('json').loads(dump)
+
+
+@pytest.mark.parametrize(('field', 'value'), [
+    (f.Int, 2 ** 70),
+    (f.Int, -2 ** 70),
+    (f.Int, 2 ** 64),
+    (f.Int, 2 ** 63),
+    (f.Int, -2 ** 63 - 1),
+    (f.Float, float('nan')),
+    (f.Float, float('inf')),
+    (f.Float, float('-inf')),
+    (f.Float, 1e308),
+    (f.String, u"ünïcödé \u2028 \U0001f41b /\"\\"),
+    (f.String, u"Inf NaN null"),
+])
+def test_edge_values(backend, field, value):
+    class Edge(StrictDict):
+        json_backend = backend.json_backend
+        edge = field()
+
+    obj = Edge(edge=value)
+    for as_bytes in (False, True):
+        dumps = [obj.to_string(as_bytes=as_bytes),
+                 Edge.dumps([obj], as_bytes=as_bytes)]
+        restored = [Edge.loads(dumps[0]), Edge.loads(dumps[1])[0],
+                    # Reads what stdlib json wrote, and the other way round
+                    Edge.loads(json.dumps(obj.simplify()))]
+        assert Edge.restore(json.loads(dumps[0])).edge == restored[0].edge or \
+            math.isnan(value)
+        for item in restored:
+            assert type(item.edge) is type(value)
+            assert repr(item.edge) == repr(value)
+
+
+def test_out_of_range_int_before_other_fields(backend):
+    class Pair(StrictDict):
+        json_backend = backend.json_backend
+        first = f.Int()
+        second = f.Int()
+
+    obj = Pair(first=-2 ** 63 - 1, second=1)
+    for as_bytes in (False, True):
+        assert json.loads(obj.to_string(as_bytes=as_bytes)) == \
+            {'first': -2 ** 63 - 1, 'second': 1}
+        assert json.loads(Pair.dumps([obj, obj], as_bytes=as_bytes)) == \
+            [{'first': -2 ** 63 - 1, 'second': 1}] * 2
+
+
+def test_default_backend():
+    # Fast backends are opt-in, so installing one changes nothing
+    assert backends.get_backend() is backends.JSONBackend
+    backends.set_default_backend('json')
+    try:
+        assert backends.get_backend() is backends.JSONBackend
+    finally:
+        backends.set_default_backend(None)
+    with pytest.raises(ValueError):
+        backends.set_default_backend('nosuchjson')
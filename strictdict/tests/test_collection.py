@@ -0,0 +1,109 @@
+# coding: utf-8
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+
+from strictdict import StrictDict, StrictDictCollection
+from strictdict import api
+from strictdict import fields as f
+
+
+class Order(StrictDict):
+    number = f.Int()
+    customer = f.String()
+    date = f.Date(required=False)
+    price = f.Float(required=False)
+    tags = api.optset(f.String)
+    item = f.ViewModelField(class_=StrictDict, required=False)
+
+
+def make_orders():
+    return [Order(number=n, customer='c%d' % (n % 3), price=float(n % 5),
+                  date=dt.date(2020, 1, 1 + n % 10) if n % 4 else None,
+                  tags={'a', 'b'} if n % 2 else {'c'})
+            for n in range(30)]
+
+
+@pytest.fixture(params=['indexed', 'scan', 'restored'])
+def orders(request):
+    objs = make_orders()
+    if request.param == 'restored':
+        objs = Order.loads(Order.dumps(objs))
+    if request.param == 'scan':
+        return StrictDictCollection(Order, objs)
+    return StrictDictCollection(
+        Order, objs, hash_indexes=['customer', 'tags'],
+        sorted_indexes=['date', 'price', 'number'])
+
+
+def test_filter(orders):
+    assert len(orders) == 30
+    assert orders[5].number == 5
+    assert [o.number for o in orders.filter(customer='c1')] == list(range(1, 30, 3))
+    assert [o.number for o in orders.filter(customer='c1', price=4.0)] == [4, 19]
+    assert [o.number for o in orders.filter(date=dt.date(2020, 1, 4))] == [3, 13, 23]
+    assert [o.number for o in orders.filter(date=None, customer='c0')] == [0, 12, 24]
+    assert len(orders.filter(tags={'b', 'a'})) == 15
+    assert orders.filter(customer='nobody') == []
+    assert len(orders.filter()) == 30
+    with pytest.raises(KeyError):
+        orders.filter(tail=1)
+
+
+def test_range(orders):
+    assert [o.number for o in orders.range('number', 27)] == [27, 28, 29]
+    assert [o.number for o in orders.range('price', high=0)] == [0, 5, 10, 15, 20, 25]
+    in_range = orders.range('date', dt.date(2020, 1, 9), dt.date(2020, 1, 10))
+    assert [o.number for o in in_range] == [18, 9, 19, 29]
+    with pytest.raises(ValueError):
+        orders.range('tags')
+
+
+def test_group_by(orders):
+    groups = orders.group_by('customer')
+    assert sorted(groups) == ['c0', 'c1', 'c2']
+    assert [o.number for o in groups['c2']] == list(range(2, 30, 3))
+    by_date = orders.group_by('date')
+    assert len(by_date[None]) == 8
+    assert len(by_date[dt.date(2020, 1, 2)]) == 3
+    assert len(orders.group_by('tags')[frozenset(['c'])]) == 15
+
+
+def test_append():
+    orders = StrictDictCollection(Order, sorted_indexes=['number'])
+    orders.extend(make_orders()[::-1])
+    assert [o.number for o in orders.range('number', 1, 2)] == [1, 2]
+    orders.append(Order(number=1, customer='late'))
+    assert [o.customer for o in orders.filter(number=1)] == ['c1', 'late']
+    with pytest.raises(TypeError):
+        orders.append(StrictDict())
+
+
+@pytest.mark.parametrize('hash_indexes', [[], ['price']])
+def test_decimal_keys(hash_indexes):
+    class Priced(StrictDict):
+        number = f.Int()
+        price = f.Decimal()
+        prices = f.Decimal(is_list=True, required=False)
+
+    records = StrictDictCollection(Priced, [
+        Priced.restore({'number': 1, 'price': '1.00', 'prices': ['1.0']}),
+        Priced(number=2, price='1.0', prices=['1.00']),
+        Priced(number=3, price='2'),
+    ], hash_indexes=hash_indexes)
+    groups = records.group_by('price')
+    assert [o.number for o in groups[Decimal('1')]] == [1, 2]
+    assert [o.number for o in records.filter(price='1.0')] == [1, 2]
+    assert [o.number for o in records.filter(price=Decimal('1.000'))] == [1, 2]
+    assert [o.number for o in records.filter(prices=['1'])] == [1, 2]
+    assert len(records.group_by('prices')) == 2
+
+
+def test_bad_indexes():
+    with pytest.raises(KeyError):
+        StrictDictCollection(Order, hash_indexes=['tail'])
+    with pytest.raises(ValueError):
+        StrictDictCollection(Order, hash_indexes=['item'])
+    with pytest.raises(ValueError):
+        StrictDictCollection(Order, sorted_indexes=['tags'])
@@ -0,0 +1,67 @@
+# coding: utf-8
+import array
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+
+from strictdict import StrictDict
+from strictdict import fields as f
+from strictdict.strictbase import columns
+
+
+class Row(StrictDict):
+    flag = f.Bool()
+    number = f.Int()
+    ratio = f.Float()
+    name = f.String()
+    price = f.Decimal()
+    date = f.Date(required=False)
+    datetime = f.DateTime()
+    tags = f.String(is_list=True)
+    comment = f.Int(required=False)
+
+
+@pytest.fixture
+def rows():
+    return [Row(flag=n % 2, number=n, ratio=n / 2, name=str(n), price=n,
+                date='2013-07-0{}'.format(n + 1) if n else None,
+                datetime=dt.datetime(2013, 11, 18, n, 11, 12, 13),
+                tags=['a'] * n, comment=n if n > 1 else None)
+            for n in range(3)]
+
+
+def check(restored, rows):
+    assert [r.simplify() for r in restored] == [r.simplify() for r in rows]
+
+
+def test_numpy_columns(rows):
+    numpy = pytest.importorskip('numpy')
+    # Mix constructed, restored and partially accessed objects
+    rows[1] = Row.restore(rows[1].simplify())
+    cols = Row.to_columns(rows)
+    assert cols['flag'].dtype == numpy.bool_
+    assert cols['number'].dtype == numpy.int64
+    assert cols['ratio'].dtype == numpy.float64
+    assert cols['name'].dtype == object
+    assert cols['price'].tolist() == [Decimal(0), Decimal(1), Decimal(2)]
+    assert cols['date'].dtype == numpy.dtype('datetime64[D]')
+    assert numpy.isnat(cols['date'][0])
+    assert cols['datetime'][2] == numpy.datetime64('2013-11-18T02:11:12.000013')
+    assert cols['tags'][2] == ('a', 'a')
+    assert cols['comment'].dtype == object
+    assert cols['number'].sum() == 3
+    check(Row.from_columns(cols), rows)
+
+    cols = Row.to_columns(rows, fields=['number'])
+    assert list(cols) == ['number']
+
+
+def test_columns_without_numpy(rows, monkeypatch):
+    monkeypatch.setattr(columns, 'numpy', None)
+    cols = Row.to_columns(iter(rows))
+    assert cols['number'] == array.array('q', [0, 1, 2])
+    assert cols['ratio'] == array.array('d', [0, 0.5, 1])
+    assert cols['date'] == [None, dt.date(2013, 7, 2), dt.date(2013, 7, 3)]
+    assert cols['comment'] == [None, None, 2]
+    check(Row.from_columns(cols), rows)
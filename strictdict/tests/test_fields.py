@@ -65,3 +65,95 @@ def test_timestamp():
     assert result == now.replace(microsecond=0)
     result = ff.deserialize(now.timestamp())
     assert result == now
+
+
+def test_intern():
+    ff = f.Decimal(intern=True)
+    first = ff.validate('1.20')
+    assert ff.validate('1.20') is first
+    # Equal but differently typed inputs are cached separately
+    assert str(ff.validate(1)) == '1'
+    assert str(ff.validate(1.0)) == '1.0'
+    # Equal values keep their own representation
+    assert str(ff.validate(Decimal('1.0'))) == '1.0'
+    assert str(ff.validate(Decimal('1.00'))) == '1.00'
+    assert str(ff.serialize(ff.validate(Decimal('0E+2')))) == '0E+2'
+    assert str(ff.serialize(ff.validate(Decimal('0')))) == '0'
+    ff = f.Float(intern=True)
+    assert str(ff.validate(0.0)) == '0.0'
+    assert str(ff.validate(-0.0)) == '-0.0'
+    assert str(ff.deserialize(0.0)) == '0.0'
+    assert str(ff.deserialize(-0.0)) == '-0.0'
+    # Same instant, different offsets
+    ff = f.DateTime(intern=True)
+    utc = dt.datetime(2013, 7, 8, 12, tzinfo=dt.timezone.utc)
+    plus_one = dt.datetime(2013, 7, 8, 13,
+                           tzinfo=dt.timezone(dt.timedelta(hours=1)))
+    assert ff.validate(utc) is ff.validate(utc)
+    assert ff.validate(plus_one).utcoffset() == dt.timedelta(hours=1)
+    ff = f.Time(intern=True)
+    assert ff.validate(plus_one.timetz()).utcoffset() == dt.timedelta(hours=1)
+
+    ff = f.Date(is_list=True, cache_size=2)
+    dates = ff.deserialize(['2013-07-08', '2013-07-08', '2013-07-09'])
+    assert dates[0] is dates[1]
+    assert dates[2] == dt.date(2013, 7, 9)
+    info = ff.cache_info()
+    assert (info['deserialize'].hits, info['deserialize'].misses) == (1, 2)
+    assert info['deserialize'].maxsize == 2
+
+    ff = f.String(intern=True)
+    with pytest.raises(ValidationError):
+        ff.validate(['unhashable'])
+    assert f.String().cache_info() is None
+    with pytest.raises(ValueError):
+        f.ViewModelField(object, intern=True)
+
+
+def test_compiled_pipelines():
+    ff = f.Int(is_list=True)
+    assert 'validate' in ff.__dict__
+    assert ff.validate(['1', 2]) == (1, 2)
+    assert ff.serialize((1, 2)) == (1, 2)
+    assert ff.deserialize([1, 2]) == (1, 2)
+    assert ff.deserialize(None) == ()
+    with pytest.raises(ValidationError) as exc:
+        ff.validate(['1', 'x'], key='numbers')
+    assert exc.value.path == ['numbers']
+    assert exc.value.class_ is f.Int
+
+    ff = f.Date(is_set=True)
+    assert ff.serialize(ff.validate({'2013-07-08'})) == ('2013-07-08',)
+    assert ff.deserialize(['2013-07-08']) == frozenset([dt.date(2013, 7, 8)])
+    with pytest.raises(ValidationError):
+        ff.validate(['2013-07-08'])
+
+    class Upper(f.String):
+        def serialize(self, data):
+            return data.upper()
+
+    ff = Upper()
+    assert 'serialize' not in ff.__dict__
+    assert ff.serialize('abc') == 'ABC'
+    assert ff.deserialize('ABC') == 'ABC'
+
+    class ShortList(f.Int):
+        def _validate_list(self, data):
+            if len(data) > 2:
+                raise ValidationError('Too long!')
+            return super(ShortList, self)._validate_list(data)
+
+    ff = ShortList(is_list=True)
+    assert ff.validate([1, 2]) == (1, 2)
+    with pytest.raises(ValidationError):
+        ff.validate([1, 2, 3])
+    assert ShortList().validate(3) == 3
+
+    class Reversed(object):
+        serialize = staticmethod(lambda data: data[::-1])
+        deserialize = staticmethod(lambda data: data[::-1])
+
+    ff = f.String(is_list=True)
+    ff.simplifier = Reversed
+    assert ff.serialize(('abc',)) == ('cba',)
+    assert ff.deserialize(['cba']) == ('abc',)
@@ -0,0 +1,54 @@
+# coding: utf-8
+import datetime as dt
+
+import pytest
+
+from strictdict.iso8601 import parse_date, parse_datetime, parse_time
+
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('2013-07-08', dt.date(2013, 7, 8)),
+    ('2013-7-8', dt.date(2013, 7, 8)),
+])
+def test_parse_date(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('10:11', dt.time(10, 11)),
+    ('10:11:12', dt.time(10, 11, 12)),
+    ('10:11:12.000013', dt.time(10, 11, 12, 13)),
+    ('10:11:12.5', dt.time(10, 11, 12, 500000)),
+    ('1:2:3', dt.time(1, 2, 3)),
+    ('1:2:3.25', dt.time(1, 2, 3, 250000)),
+])
+def test_parse_time(value, expected):
+    assert parse_time(value) == expected
+
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('2013-11-18T10:11', dt.datetime(2013, 11, 18, 10, 11)),
+    ('2013-11-18T10:11:12', dt.datetime(2013, 11, 18, 10, 11, 12)),
+    ('2013-11-18T10:11:12Z', dt.datetime(2013, 11, 18, 10, 11, 12)),
+    ('2013-11-18T10:11:12.123456Z',
+     dt.datetime(2013, 11, 18, 10, 11, 12, 123456)),
+])
+def test_parse_datetime(value, expected):
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(('parser', 'value'), [
+    (parse_date, '2013-07'),
+    (parse_date, '2013-13-01'),
+    (parse_date, 'abcd-ef-gh'),
+    (parse_time, '10'),
+    (parse_time, '10:11:12.'),
+    (parse_time, '10:11:12.1234567'),
+    (parse_time, '25:00'),
+    (parse_datetime, '2013-11-18'),
+    (parse_datetime, '2013-11-18T'),
+    (parse_datetime, '2013-11-18 10:11'),
+])
+def test_invalid(parser, value):
+    with pytest.raises(ValueError):
+        parser(value)
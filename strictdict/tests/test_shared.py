@@ -0,0 +1,77 @@
+# coding: utf-8
+import concurrent.futures
+import os
+import subprocess
+import sys
+
+import pytest
+
+from strictdict import StrictDict
+from strictdict import fields as f
+from strictdict import shared
+
+pytestmark = pytest.mark.skipif(shared.shared_memory is None,
+                                reason='needs multiprocessing.shared_memory')
+
+
+class Record(StrictDict):
+    number = f.Int()
+    name = f.String()
+    price = f.Decimal(required=False)
+
+
+def total(name):
+    with shared.SharedBatch(Record, name) as batch:
+        return len(batch), sum(record.number for record in batch)
+
+
+def test_shared_batch():
+    records = [Record(number=n, name=u"запись %d" % n, price='1.5')
+               for n in range(100)]
+    batch = shared.SharedBatch.create(Record, records)
+    try:
+        assert len(batch) == 100
+        assert batch[3] == records[3]
+        assert batch[-1].name == u"запись 99"
+        assert [r.number for r in batch[10:40:10]] == [10, 20, 30]
+        with pytest.raises(IndexError):
+            batch[100]
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            assert executor.submit(total, batch.name).result() == (100, 4950)
+    finally:
+        batch.close()
+        batch.unlink()
+
+
+def test_empty_batch():
+    batch = shared.SharedBatch.create(Record, [])
+    with batch:
+        assert len(batch) == 0
+        assert list(batch) == []
+    batch.unlink()
+
+
+CONSUMER_SCRIPT = '''
+import sys
+from strictdict import SharedBatch
+from strictdict.tests.test_shared import Record
+
+with SharedBatch(Record, sys.argv[1]) as batch:
+    print(len(batch), batch[2].number)
+'''
+
+
+def test_independent_consumers():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=root)
+    batch = shared.SharedBatch.create(
+        Record, [Record(number=n, name='x') for n in range(3)])
+    with batch:
+        # Each consumer has its own resource tracker, exiting must not
+        # unlink the segment under the next one
+        for _ in range(2):
+            output = subprocess.check_output(
+                [sys.executable, '-c', CONSUMER_SCRIPT, batch.name], env=env)
+            assert output.split() == [b'3', b'2']
+    batch.unlink()
@@ -0,0 +1,58 @@
+# coding: utf-8
+import pytest
+
+from strictdict import StrictDict, StrictDictStore
+from strictdict import fields as f
+
+
+class Record(StrictDict):
+    number = f.Int()
+    name = f.String()
+    price = f.Decimal(required=False)
+
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join('records'))
+
+
+def test_append_and_read(path):
+    with StrictDictStore(Record, path) as store:
+        assert len(store) == 0
+        assert list(store) == []
+        for n in range(10):
+            assert store.append(Record(number=n, name=u"запись %d" % n)) == n
+        assert store[3].number == 3
+        assert store[-1].name == u"запись 9"
+        # Appending after the store was mapped for reading
+        store.extend(Record(number=n, name='x', price=n) for n in range(10, 15))
+        assert len(store) == 15
+        assert store[14].price == 14
+        assert [r.number for r in store[2:12:3]] == [2, 5, 8, 11]
+        with pytest.raises(IndexError):
+            store[15]
+
+    with StrictDictStore(Record, path) as store:
+        assert len(store) == 15
+        assert [r.number for r in store] == list(range(15))
+        store.append(Record(number=15, name='last'))
+
+    with StrictDictStore(Record, path) as store:
+        assert store[15].name == 'last'
+
+
+def test_partial_index_entry(path):
+    with StrictDictStore(Record, path) as store:
+        store.append(Record(number=1, name='one'))
+    # Interrupted write of the next index entry
+    with open(path + '.idx', 'ab') as index_file:
+        index_file.write(b'\x00\x01')
+
+    with StrictDictStore(Record, path) as store:
+        assert len(store) == 1
+        assert store[0].name == 'one'
+        assert store.append(Record(number=2, name='two')) == 1
+        assert store[1].name == 'two'
+
+    with StrictDictStore(Record, path) as store:
+        assert [r.name for r in store] == ['one', 'two']
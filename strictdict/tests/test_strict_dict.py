@@ -3,9 +3,22 @@
 Test behaviour of StrictDict mega-class
 """
 
+import concurrent.futures
+import copy
+import gc
+import io
+import json
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+import threading
+
+import msgpack
 import pytest
 
-from strictdict import StrictDict
+from strictdict import Invalid, StrictDict
 from strictdict import fields as f
 from strictdict import ValidationError
 from strictdict import api
@@ -28,6 +41,23 @@ class Centipede(StrictDict):
     favorite_leg = f.ViewModelField(class_=Leg, required=False)
 
 
+class GenericLeg(Leg):
+    is_compiled_init = False
+
+
+class LazyLeg(Leg):
+    is_lazy_simplify = True
+
+
+class LazyCentipede(Centipede):
+    is_lazy_simplify = True
+    legs = f.ViewModelField(class_=LazyLeg, is_list=True)
+
+
+class Walker(Leg):
+    __ignored_fields__ = ['name']
+
+
 class Missing(object):
     pass
 
@@ -380,3 +410,574 @@ def tests_name_collision():
     except Exception as e:
         ex = e
     assert ex.__class__.__name__ == 'NameCollisionError'
+
+
+def test_compiled_init(leg_data):
+    assert Leg.__init__.__compiled_for__ is Leg
+
+    assert GenericLeg.__init__ is StrictDict.__init__
+    compiled = Leg(**leg_data)
+    generic = GenericLeg(**leg_data)
+    assert compiled.simplify() == generic.simplify()
+    assert dict(compiled) == dict(generic)
+
+    bad_data = dict(leg_data, name=None, number='-', abyr='valg')
+    errors = []
+    for cls in (Leg, GenericLeg):
+        with pytest.raises(ValidationError) as exc:
+            cls(**bad_data)
+        errors.append((exc.value.message, exc.value.errors))
+    assert errors[0] == errors[1]
+
+
+def test_compiled_init_simplifier_change():
+    class Upper(object):
+        serialize = staticmethod(lambda data: data.upper())
+        deserialize = staticmethod(lambda data: data)
+
+    class Shout(StrictDict):
+        s = f.String()
+
+    assert Shout(s='x').simplify() == {'s': 'x'}
+    Shout.__fields__['s'].simplifier = Upper
+    assert Shout(s='x').simplify() == {'s': 'X'}
+    objects, _ = Shout.from_records([{'s': 'y'}])
+    assert objects[0].simplify() == {'s': 'Y'}
+    assert Shout.try_create(s='z').simplify() == {'s': 'Z'}
+
+
+def test_compiled_init_custom_constructor(leg_data):
+    class CustomLeg(Leg):
+        tag = f.String(required=False)
+
+        def __init__(self, **kwargs):
+            kwargs.setdefault('tag', 'custom')
+            super(CustomLeg, self).__init__(**kwargs)
+
+    class ChildLeg(CustomLeg):
+        pass
+
+    for cls in (CustomLeg, ChildLeg):
+        leg = cls(**leg_data)
+        assert leg.tag == 'custom'
+        assert leg.name == leg_data['name']
+
+
+def test_lazy_simplify(leg_data):
+    leg_data['date'] = '2013-07-08'
+    eager = Leg(**leg_data)
+    lazy = LazyLeg(**leg_data)
+    assert lazy._simplified is None
+    assert list(lazy) == list(eager)
+    assert len(lazy) == len(eager)
+    assert 'name' in lazy
+    assert 'no_such_field' not in lazy
+    assert lazy.market_price == eager.market_price
+    assert lazy._simplified is None
+
+    assert lazy.simplify() == eager.simplify()
+    assert LazyLeg.loads(lazy.to_string()).date == eager.date
+
+    centipede = LazyCentipede(age=1, legs=[leg_data] * 3)
+    restored = Centipede.loads(centipede.to_string())
+    assert restored.legs[2].name == leg_data['name']
+    assert hash(centipede) == hash(LazyCentipede.restore(restored.simplify()))
+
+
+def test_compact_layout(leg_data):
+    class CompactLeg(StrictDict):
+        # Every class in the hierarchy has to be compact
+        __fields__ = dict(Leg.__fields__)
+        is_compact = True
+
+    class CompactChildLeg(CompactLeg):
+        pass
+
+    for cls in (CompactLeg, CompactChildLeg):
+        leg = cls(**leg_data)
+        assert not hasattr(leg, '__dict__')
+        assert dict(leg) == dict(Leg(**leg_data))
+        restored = cls.restore(leg.simplify())
+        assert not hasattr(restored, '__dict__')
+        assert restored.name == leg_data['name']
+        assert cls.loads(leg.to_string()).number == leg_data['number']
+
+
+def test_memoize(centipede):
+    msgpacked = centipede.to_string(msg_pack=True)
+    assert centipede.to_string(msg_pack=True) is msgpacked
+    assert centipede.to_string() is centipede.to_string()
+    assert hash(centipede) == hash(msgpacked)
+
+    legs = list(centipede.legs)
+    assert Centipede.dumps(legs) == json.dumps([leg.simplify() for leg in legs])
+    assert Centipede.dumps(legs, msg_pack=True) == \
+        msgpack.dumps([leg.simplify() for leg in legs])
+    assert Centipede.dumps([]) == '[]'
+    assert Centipede.loads(Centipede.dumps([], msg_pack=True), msg_pack=True) == []
+
+    class PlainLeg(Leg):
+        is_memoize = False
+
+    leg = PlainLeg(**leg_data())
+    assert leg.to_string() == leg.to_string()
+    assert leg.to_string() is not leg.to_string()
+    assert hash(leg) == hash(leg.to_string(msg_pack=True))
+    assert not hasattr(leg, '_cache')
+
+
+@pytest.mark.parametrize(('msg_pack', 'stream_class'), [
+    (False, io.StringIO),
+    (False, io.BytesIO),
+    (True, io.BytesIO),
+])
+def test_stream(msg_pack, stream_class):
+    stream = stream_class()
+    count = Centipede.dump_stream(
+        (Centipede(age=age, legs=[leg_data()]) for age in range(5)), stream,
+        msg_pack=msg_pack)
+    assert count == 5
+    stream.seek(0)
+    restored = Centipede.load_stream(stream, msg_pack=msg_pack)
+    assert not isinstance(restored, list)
+    restored = list(restored)
+    assert [c.age for c in restored] == list(range(5))
+    assert restored[4].legs[0].name == leg_data()['name']
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_iter_loads(chunk_size):
+    centipedes = [Centipede(age=age, legs=[dict(leg_data(), name=u"Нога")])
+                  for age in range(20)]
+    dump = Centipede.dumps(centipedes)
+    for data in (dump, dump.encode('utf-8'), io.BytesIO(dump.encode('utf-8')),
+                 io.StringIO(' \n' + dump + '\n')):
+        restored = Centipede.iter_loads(data, chunk_size=chunk_size)
+        assert not isinstance(restored, list)
+        restored = list(restored)
+        assert [c.age for c in restored] == list(range(20))
+        assert restored[-1].legs[0].name == u"Нога"
+
+    assert list(Centipede.iter_loads(' [ ] ', chunk_size=chunk_size)) == []
+    for broken in ('', '{}', '[{"age": 1}', '[{"age": 1},]', '[{"age": 1}}',
+                   '[{"age": 1}] garbage', '[] []', '[]]'):
+        with pytest.raises(ValueError):
+            list(Centipede.iter_loads(broken, chunk_size=chunk_size))
+
+
+def test_from_records(leg_data):
+    records = [dict(leg_data, number=n) for n in range(5)]
+    records[1]['number'] = '-'
+    records[3]['abyr'] = 'valg'
+    for cls in (Leg, GenericLeg):
+        with pytest.raises(ValidationError):
+            cls.from_records(records)
+
+        objects, report = cls.from_records(records, errors='collect')
+        assert [obj and obj.number for obj in objects] == [0, None, 2, None, 4]
+        assert [index for index, exc in report] == [1, 3]
+        assert report[0][1].errors[0]['number']
+        assert all(isinstance(exc, ValidationError) for _, exc in report)
+
+        objects, report = cls.from_records(iter(records), errors='skip')
+        assert [obj.number for obj in objects] == [0, 2, 4]
+        assert len(report) == 2
+        assert all(type(obj) is cls for obj in objects)
+        assert objects[0].simplify() == cls(**records[0]).simplify()
+
+    connection = sqlite3.connect(':memory:')
+    connection.row_factory = sqlite3.Row
+    rows = connection.execute(
+        "SELECT 1 AS is_working, 7 AS number, 'Mary' AS name").fetchall()
+    for cls in (Leg, GenericLeg):
+        objects, report = cls.from_records(rows)
+        assert objects[0].name == 'Mary'
+        assert objects[0].number == 7
+
+    objects, report = Centipede.from_records([{'age': 1, 'legs': records[:1]}])
+    assert objects[0].legs[0].name == leg_data['name']
+    assert report == []
+    with pytest.raises(ValueError):
+        Leg.from_records([], errors='ignore')
+
+
+def test_pickle(centipede):
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(centipede, protocol))
+        assert type(restored) is Centipede
+        assert restored.simplify() == centipede.simplify()
+        assert restored.legs[3].market_price == centipede.legs[3].market_price
+    assert copy.deepcopy(centipede).simplify() == centipede.simplify()
+
+    with pytest.raises(ValidationError) as exc:
+        Leg(is_working='Kinda')
+    restored = pickle.loads(pickle.dumps(exc.value))
+    assert restored.message == exc.value.message
+    assert restored.errors == exc.value.errors
+    assert restored.class_ is Leg
+
+
+def test_validate_parallel(leg_data):
+    records = [dict(leg_data, number=n) for n in range(25)]
+    records[11]['number'] = '-'
+    objects, report = Leg.validate_parallel(
+        records, workers=2, chunksize=4, errors='collect')
+    assert len(objects) == 25
+    assert objects[11] is None
+    assert [obj.number for obj in objects if obj] == \
+        [n for n in range(25) if n != 11]
+    assert [index for index, exc in report] == [11]
+    assert 'number' in report[0][1].errors[0]
+
+    with pytest.raises(ValidationError):
+        Leg.validate_parallel(records, workers=2, chunksize=4)
+
+
+def test_evolve(centipede):
+    older = centipede.evolve(age=101)
+    assert older.age == 101
+    assert centipede.age == 100
+    assert older.legs is centipede.legs
+    assert older.simplify()['legs'] is centipede.simplify()['legs']
+    assert older.simplify() == dict(centipede.simplify(), age=101)
+    assert Centipede(**older).simplify() == older.simplify()
+
+    no_favorite = centipede.evolve(favorite_leg=None)
+    assert no_favorite.favorite_leg is None
+    assert 'favorite_leg' not in no_favorite.simplify()
+
+    with pytest.raises(ValidationError):
+        centipede.evolve(age='old')
+    with pytest.raises(ValidationError):
+        centipede.evolve(legs=None)
+    with pytest.raises(ValidationError):
+        centipede.evolve(tail=1)
+
+    restored = Centipede.restore(centipede.simplify())
+    assert restored.evolve(age=1).legs[0].name == leg_data()['name']
+
+
+def test_evolve_lazy(leg_data):
+    leg = LazyLeg(**leg_data)
+    changed = leg.evolve(name='Mary', boot_color=None)
+    assert changed._simplified is None
+    assert changed.name == 'Mary'
+    assert 'boot_color' not in list(changed)
+    assert changed.simplify() == Leg(**dict(leg_data, name='Mary', boot_color=None)).simplify()
+
+
+def test_evolve_path(centipede):
+    changed = centipede.evolve_path('legs.3.name', 'Mary')
+    assert changed.legs[3].name == 'Mary'
+    assert centipede.legs[3].name == leg_data()['name']
+    assert changed.legs[2] is centipede.legs[2]
+    assert changed.favorite_leg is centipede.favorite_leg
+
+    changed = changed.evolve_path('favorite_leg.number', 7)
+    assert changed.favorite_leg.number == 7
+    assert changed.legs[3].name == 'Mary'
+
+    changed = centipede.evolve_path('legs.0', leg_data())
+    assert isinstance(changed.legs[0], Leg)
+
+    with pytest.raises(KeyError):
+        centipede.evolve_path('legs.10.name', 'Mary')
+    with pytest.raises(KeyError):
+        centipede.evolve_path('age.years', 1)
+    with pytest.raises(ValidationError):
+        centipede.evolve_path('legs.1.number', 'one')
+
+
+def test_projection(centipede):
+    only = ['age', 'legs.number', 'favorite_leg.name']
+    projected = Centipede.projection(only)
+    assert projected is Centipede.projection(reversed(only))
+    assert issubclass(projected, Centipede)
+    assert set(projected.__fields__) == {'age', 'legs', 'favorite_leg'}
+    assert set(projected.__fields__['legs'].class_.__fields__) == {'number'}
+
+    for msg_pack in (False, True):
+        dump = centipede.to_string(msg_pack=msg_pack)
+        restored = Centipede.loads(dump, msg_pack=msg_pack, only=only)
+        assert type(restored) is projected
+        assert restored.age == 100
+        assert restored.legs[3].number == 1
+        assert restored.favorite_leg.name == leg_data()['name']
+        assert list(restored.legs[3]) == ['number']
+        with pytest.raises(AttributeError):
+            restored.legs[3].name
+        assert json.loads(restored.to_string()) == {
+            'age': 100, 'legs': [{'number': 1}] * 10,
+            'favorite_leg': {'name': leg_data()['name']}}
+
+        restored = Centipede.loads(Centipede.dumps([centipede] * 2, msg_pack=msg_pack),
+                                   msg_pack=msg_pack, only=['legs'])
+        assert len(restored) == 2
+        assert list(restored[1]) == ['legs']
+        assert restored[1].legs[0].name == leg_data()['name']
+
+    restored = Centipede.restore(centipede.simplify(), only=only)
+    unpickled = pickle.loads(pickle.dumps(restored))
+    assert type(unpickled) is projected
+    assert unpickled == restored
+    leg = pickle.loads(pickle.dumps(restored.legs[0]))
+    assert type(leg) is type(restored.legs[0])
+    assert dict(leg) == {'number': 1}
+
+    restored = Centipede.restore(centipede.simplify(), only=['legs', 'legs.name'])
+    assert list(restored.legs[0]) == list(centipede.legs[0])
+    with pytest.raises(KeyError):
+        Centipede.projection(['tail'])
+    with pytest.raises(KeyError):
+        Centipede.projection(['age.years'])
+
+
+def test_try_create(leg_data):
+    class EmptyCentipede(StrictDict):
+        legs = f.ViewModelField(class_=Leg, is_list=True, required=False)
+
+    for cls in (Leg, GenericLeg):
+        leg = cls.try_create(**leg_data)
+        assert isinstance(leg, cls)
+        assert cls.check(**leg_data) is None
+
+        invalid = cls.try_create(**dict(leg_data, number='-', name=None))
+        assert isinstance(invalid, Invalid)
+        assert invalid.paths == ['number', 'name']
+        assert invalid.message == 'ValidationError in fields: number, name'
+        with pytest.raises(ValidationError) as exc:
+            cls(**dict(leg_data, number='-', name=None))
+        assert invalid.exception().errors == exc.value.errors
+        assert invalid.exception().message == exc.value.message
+
+        invalid = cls.check(**dict(leg_data, tail=1))
+        assert 'tail' in invalid.message
+    assert Leg.check(**dict(leg_data, tail=1)).paths == ['tail']
+
+    invalid = Centipede.try_create(age=1, legs=[leg_data, dict(leg_data, is_working='568')])
+    assert invalid.paths == ['legs.is_working']
+    assert isinstance(EmptyCentipede.try_create(), EmptyCentipede)
+    assert EmptyCentipede.check() is None
+
+
+def test_lazy_error_rendering(leg_data):
+    class Loud(object):
+        def __repr__(self):
+            raise AssertionError('repr should not be called')
+
+    with pytest.raises(ValidationError) as exc:
+        Leg(**dict(leg_data, number=Loud()))
+    field_error = exc.value.errors[0]['number']
+    assert field_error.startswith('Failed to validate')
+
+    invalid = Centipede.try_create(age=1, legs=[dict(leg_data, number=Loud())])
+    assert invalid.paths == ['legs.number']
+
+    ff = f.Int()
+    with pytest.raises(ValidationError) as exc:
+        ff.validate('x')
+    assert exc.value.value == "'x'"
+
+
+def test_equality(centipede, leg_data):
+    assert centipede == Centipede(age=100, legs=[leg_data] * 10, favorite_leg=leg_data)
+    assert centipede != centipede.evolve(age=1)
+    # Lists come back from JSON where constructed objects have tuples
+    assert Centipede.loads(centipede.to_string()) == centipede
+    assert Leg(**dict(leg_data, market_price='1.0')) == \
+        Leg(**dict(leg_data, market_price='1.00'))
+    assert Leg(**leg_data) != Leg(**dict(leg_data, boot_color=None))
+    assert Leg(**leg_data) == dict(Leg(**leg_data))
+    assert Leg(**leg_data) != 'leg'
+
+    assert LazyLeg(**leg_data) == LazyLeg.restore(Leg(**leg_data).simplify())
+
+    walker = Walker(**dict(leg_data, name=None))
+    assert Walker.restore(dict(walker.simplify(), name='x')) == walker
+    assert Walker.restore(dict(walker.simplify(), name='x')) == \
+        Walker.restore(dict(walker.simplify(), name='y'))
+
+
+def test_ordering(leg_data):
+    class OrderedLeg(Leg):
+        __order_by__ = ('boot_size', 'market_price', 'number')
+
+    legs = [OrderedLeg(**dict(leg_data, number=n, boot_size=size, market_price=price))
+            for n, size, price in [(1, 40, '10'), (2, 40, '9'), (3, None, '1'),
+                                   (4, 39.5, '1'), (5, 40, '9')]]
+    assert [leg.number for leg in sorted(legs)] == [3, 4, 2, 5, 1]
+    assert legs[1] < legs[4] <= legs[4] < legs[0]
+    assert legs[0] > legs[3] >= legs[3]
+    assert OrderedLeg.restore(legs[2].simplify()) < legs[3]
+    with pytest.raises(TypeError):
+        Leg(**leg_data) < Leg(**leg_data)
+    with pytest.raises(ValueError):
+        class BadOrder(Leg):
+            __order_by__ = ('tail',)
+
+
+CANONICAL_SCRIPT = '''
+from strictdict import StrictDict, api
+from strictdict import fields as f
+
+class Tagged(StrictDict):
+    is_canonical = True
+    tags = api.sset(f.String)
+    counts = api.ref(f.MapField, api.ref(f.String), api.ref(f.Int))
+
+obj = Tagged(tags={'red', 'green', 'blue', 'cyan'},
+             counts={'x': 1, 'b': 2, 'k': 3, 'a': 4})
+print(obj.to_string(msg_pack=True).hex(), obj.content_id())
+'''
+
+
+def test_canonical():
+    class Tagged(StrictDict):
+        is_canonical = True
+        tags = api.sset(f.String)
+        counts = api.ref(f.MapField, api.ref(f.String), api.ref(f.Int))
+
+    first = Tagged(tags={'b', 'a', 'c'}, counts={'y': 1, 'x': 2})
+    second = Tagged.restore({'counts': {'x': 2, 'y': 1}, 'tags': ['c', 'a', 'b']})
+    assert first.simplify()['tags'] == ('a', 'b', 'c')
+    assert first.to_string() == second.to_string()
+    assert first.to_string(msg_pack=True) == second.to_string(msg_pack=True)
+    assert hash(first) == hash(second)
+    assert first.content_id() == second.content_id()
+    assert first.content_id() != first.evolve(tags={'a'}).content_id()
+    assert Tagged.loads(first.to_string()) == first
+
+    # Not canonical encoding keeps field order, content_id does not
+    leg = Leg(**leg_data())
+    restored = Leg.restore(dict(reversed(list(leg.simplify().items()))))
+    assert leg.to_string() != restored.to_string()
+    assert leg.content_id() == restored.content_id()
+
+    # Nested objects in sets are ordered by their content
+    class Herd(StrictDict):
+        is_canonical = True
+        legs = f.ViewModelField(class_=Leg, is_set=True)
+
+    legs = [Leg(**dict(leg_data(), number=n)) for n in range(5)]
+    first = Herd(legs=set(legs))
+    second = Herd.restore({'legs': [leg.simplify() for leg in legs[::-1]]})
+    assert first.to_string() == second.to_string()
+    assert first.content_id() == second.content_id()
+
+
+def test_canonical_across_processes():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    outputs = set()
+    for seed in ('1', '2', '3', '4'):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=root)
+        outputs.add(subprocess.check_output(
+            [sys.executable, '-c', CANONICAL_SCRIPT], env=env))
+    assert len(outputs) == 1
+
+
+def test_interned(leg_data):
+    class SharedLeg(Leg):
+        is_interned = True
+
+    class Herd(StrictDict):
+        legs = f.ViewModelField(class_=SharedLeg, is_list=True)
+
+    herd = Herd(legs=[leg_data] * 5 + [dict(leg_data, number=2)])
+    assert len({id(leg) for leg in herd.legs}) == 2
+    restored = Herd.loads(herd.to_string())
+    assert len({id(leg) for leg in restored.legs}) == 2
+    assert restored.legs[0] is herd.legs[0]
+    assert SharedLeg(**leg_data).intern() is herd.legs[0]
+    # Not interned classes are left alone
+    centipede = Centipede(age=1, legs=[leg_data] * 2)
+    assert centipede.legs[0] is not centipede.legs[1]
+
+    del herd, restored
+    gc.collect()
+    assert len(SharedLeg._intern_table) == 0
+
+
+def test_field_descriptors(leg_data):
+    leg = Leg(**leg_data)
+    assert leg.name == 'Martha'
+    assert leg.date is None
+    assert Leg.restore(leg.simplify()).market_price == leg.market_price
+    with pytest.raises(AttributeError):
+        leg.name = 'Bob'
+    with pytest.raises(AttributeError):
+        del leg.name
+    with pytest.raises(AttributeError):
+        leg.tail
+
+    class TitledLeg(Leg):
+        @property
+        def name(self):
+            return self['name'].title()
+
+        def number(self):
+            return 'method'
+
+    titled = TitledLeg(**dict(leg_data, name='martha'))
+    assert titled.name == 'Martha'
+    assert titled['name'] == 'martha'
+    assert titled.number() == 'method'
+
+    nameless = Walker.restore(leg.simplify())
+    with pytest.raises(AttributeError):
+        nameless.name
+    with pytest.raises(KeyError):
+        nameless['name']
+
+
+def test_views(centipede):
+    restored = Centipede.restore(centipede.simplify())
+    assert list(restored.keys()) == ['age', 'legs', 'favorite_leg']
+    assert 'legs' in restored.keys()
+    assert dict(restored.items()) == dict(centipede.items())
+    assert list(restored.values())[0] == 100
+    assert isinstance(restored.favorite_leg, Leg)
+
+    raw = Centipede.restore(centipede.simplify())
+    view = raw.simplified_view()
+    assert view['favorite_leg'] == leg_data()
+    assert dict(raw.raw_items()) == dict(view)
+    # Nothing got deserialized
+    assert raw._storage == {}
+    with pytest.raises(TypeError):
+        view['age'] = 1
+
+    walker = Walker.restore(Leg(**leg_data()).simplify())
+    assert 'name' not in list(walker)
+    assert 'name' not in dict(walker.items())
+
+
+def test_concurrent_reads(centipede):
+    def read(shared, barrier):
+        barrier.wait()
+        return (shared.legs, shared['favorite_leg'], dict(shared.items()),
+                [leg.market_price for leg in shared.legs], hash(shared),
+                shared.to_string(), shared.content_id())
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            for shared in (Centipede.restore(centipede.simplify()),
+                           LazyCentipede(**dict(centipede.items()))):
+                barrier = threading.Barrier(8)
+                with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                    results = list(executor.map(
+                        lambda _: read(shared, barrier), range(8)))
+                legs, favorite, items, prices, hash_, dump, content_id = results[0]
+                assert legs == centipede.legs
+                assert prices == [leg.market_price for leg in centipede.legs]
+                assert dump == shared.to_string()
+                for result in results[1:]:
+                    # Everyone got the very objects published first
+                    assert result[0] is legs
+                    assert result[1] is favorite
+                    assert all(result[2][key] is value for key, value in items.items())
+                    assert result[3:] == (prices, hash_, dump, content_id)
+    finally:
+        sys.setswitchinterval(interval)
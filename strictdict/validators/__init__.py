@@ -4,8 +4,14 @@ Validators check objects on asignment and do coercion if needed
 import datetime as dt
 import decimal
 
+from ..iso8601 import parse_date, parse_datetime, parse_time
+
 
 class ValidationError(Exception):
+    """
+    `message` may be a callable returning the message, it is called when
+    the message is first read
+    """
 
     def __init__(self, message, class_=None, path=None, value=None,
                  errors=None, *args, **kwargs):
@@ -13,11 +19,42 @@ class ValidationError(Exception):
             errors = []
         self.errors = errors
         self.path = path or []
-        self.value = value
+        self._value = value
         self.class_ = class_
-        self.message = message
+        self._message = message
         super(ValidationError, self).__init__(*args, **kwargs)
 
+    @property
+    def message(self):
+        if callable(self._message):
+            self._message = self._message()
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        self._message = message
+
+    @property
+    def value(self):
+        if isinstance(self._value, _LazyRepr):
+            self._value = repr(self._value.data)
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    def set_default_value(self, data):
+        """
+        Unless value is set, make it repr(data), rendered when first read
+        """
+        if not self._value:
+            self._value = _LazyRepr(data)
+
+    def __reduce__(self):
+        return self.__class__, (self.message, self.class_, self.path,
+                                self.value, self.errors)
+
     def __str__(self):
         clsname = self.class_.__name__ if self.class_ else '<No class>'
         path_display = ".".join([str(clsname)] + list(reversed(self.path)))
@@ -25,19 +62,26 @@ class ValidationError(Exception):
             self.value, path_display, self.message)
 
 
+class _LazyRepr(object):
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+
 def DummyValidator(data):
     "Passes through whatever comes to it"
     return data
 
 
 def SimpleTypeValidator(_type, error_classes=[ValueError]):
+    error_msg = "Failed to validate as %s" % _type
+    error_classes = tuple(error_classes) + (TypeError,)
+
     def validator(data):
-        error_msg = "Failed to validate as %s" % _type
         try:
             return _type(data)
-        except tuple(error_classes) as e:
-            raise ValidationError("{0}: {1}".format(error_msg, e))
-        except TypeError as e:
+        except error_classes as e:
             raise ValidationError("{0}: {1}".format(error_msg, e))
     return validator
 
@@ -68,11 +112,14 @@ def StringNumValidator(data):
 IntValidator = SimpleTypeValidator(int)
 
 
+_decimal_validator = SimpleTypeValidator(
+    decimal.Decimal, [decimal.InvalidOperation, ValueError])
+
+
 def DecimalValidator(data):
     if isinstance(data, float):
         data = str(data)
-    return SimpleTypeValidator(
-        decimal.Decimal, [decimal.InvalidOperation, ValueError])(data)
+    return _decimal_validator(data)
 
 
 def CurrencyValidator(data):
@@ -133,34 +180,3 @@ def TimeStampValidator(data):
     elif isinstance(data, dt.datetime):
         return data
     raise ValidationError('Not a timestamp [%s]' % data)
-
-
-def parse_datetime(s):
-    parts = s.split('T')
-    if len(parts) == 2:
-        time_str = parts[1]
-        if time_str[-1] == 'Z':
-            time_str = time_str[:-1]
-        return dt.datetime.combine(parse_date(parts[0]), parse_time(time_str))
-    raise ValueError('Invalid datetime format')
-
-
-def parse_date(s):
-    parts = s.split('-')
-    if len(parts) == 3:
-        return dt.date(int(parts[0]), int(parts[1]), int(parts[2]))
-    raise ValueError('Invalid date format')
-
-
-def parse_time(s):
-    parts = s.split(':')
-    if len(parts) >= 2:
-        s = 0
-        mcs = 0
-        if len(parts) == 3:
-            mparts = parts[2].split('.')
-            s = int(mparts[0])
-            if len(mparts) > 1:
-                mcs = int(mparts[1])
-        return dt.time(int(parts[0]), int(parts[1]), s, mcs)
-    raise ValueError('Invalid time format')